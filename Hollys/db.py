@@ -1,8 +1,12 @@
 import os
+import sys
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 
+# 🔥 sys.path 추가하여 crawling 경로의 공용 모듈(html_parsing) 사용 (프로젝트 루트에서 실행해도 동작)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from html_parsing import parse_html
+
 # 저장할 폴더 지정
 DATA_DIR = "data"
 
@@ -14,20 +18,20 @@ if __name__ == "__main__":
     url = "https://www.hollys.co.kr/store/korea/korStore2.do"
     response = requests.get(url)
     response.encoding = "utf-8"
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = parse_html(response.text, subtree=('class="tbl_store"', "</table>"))  # ✅ 매장 테이블 구간만 파싱
 
     # 2. 매장 정보 추출
     stores = [
         {
-            "지역": cols[0].text.strip(),
-            "매장명": cols[1].text.strip(),
-            "현황": cols[2].text.strip(),
-            "주소": cols[3].text.strip(),
-            "서비스": ", ".join(img["alt"] for img in cols[4].find_all("img")),
-            "전화번호": cols[5].text.strip(),
+            "지역": cols[0].text().strip(),
+            "매장명": cols[1].text().strip(),
+            "현황": cols[2].text().strip(),
+            "주소": cols[3].text().strip(),
+            "서비스": ", ".join(img.get("alt", "") for img in cols[4].select("img")),
+            "전화번호": cols[5].text().strip(),
         }
         for row in soup.select("table.tbl_store tbody tr")
-        if (cols := row.find_all("td")) and len(cols) >= 6
+        if (cols := row.select("td")) and len(cols) >= 6
     ]
 
     # 데이터프레임 변환 및 저장
@@ -0,0 +1,65 @@
+import re
+import time
+from html_parsing import BACKENDS, parse_html
+
+# 저장해 둔 페이지로 HTML 파서별 속도 비교
+# 사용법: python bench_parsing.py (프로젝트 루트에서 실행)
+REPEAT = 20
+YNA_SECTION = ('class="box-type011 box-latest01"', "</section>")
+
+
+# 연합뉴스 목록: 기사 카드에서 제목/링크/시간/요약/이미지 추출
+def extract_yna(document):
+    rows = []
+    for article in document.select("div.item-box01"):
+        title = article.select_one("a.tit-news span.title01")
+        link = article.select_one("a.tit-news")
+        date = article.select_one("span.txt-time")
+        summary = article.select_one("p.lead")
+        image = article.select_one("figure.img-con01 img")
+        rows.append((
+            title.text(strip=True) if title else None,
+            link.get("href") if link else None,
+            date.text(strip=True) if date else None,
+            summary.text(strip=True) if summary else None,
+            image.get("src") if image else None,
+        ))
+    return rows
+
+
+# 일반 페이지: 표 행/링크 수집
+def extract_generic(document):
+    return [row.text(strip=True) for row in document.select("tr")] + [a.get("href") for a in document.select("a")]
+
+
+def load(path):
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    # Hollys/text.txt 는 "1. <!DOCTYPE ..." 처럼 줄 번호가 붙어 저장돼 있음
+    return re.sub(r"(?m)^\d+\. ", "", text)
+
+
+CASES = [
+    ("yunhap/yna.txt (전체 페이지)", "yunhap/yna.txt", extract_yna, None),
+    ("yunhap/yna.txt (기사 목록 구간만)", "yunhap/yna.txt", extract_yna, YNA_SECTION),
+    ("data/asdf.txt", "data/asdf.txt", extract_yna, None),
+    ("Hollys/text.txt", "Hollys/text.txt", extract_generic, None),
+]
+
+
+def run_benchmark(repeat=REPEAT):
+    for name, path, extract, subtree in CASES:
+        html = load(path)
+        print(f"\n📄 {name} ({len(html) / 1024:.0f} KB)")
+        baseline = None
+        for backend in BACKENDS:
+            start = time.perf_counter()
+            for _ in range(repeat):
+                rows = extract(parse_html(html, backend, subtree))
+            ms = (time.perf_counter() - start) * 1000 / repeat
+            baseline = baseline or ms
+            print(f"  {backend:<12} {ms:8.2f} ms  (x{baseline / ms:4.1f})  결과 {len(rows)}개")
+
+
+if __name__ == "__main__":
+    run_benchmark()
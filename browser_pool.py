@@ -0,0 +1,142 @@
+import time
+import queue
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import WebDriverException
+from dynamic_crawling import driver
+
+
+class PooledBrowser:
+    """ 풀에서 관리하는 WebDriver + 사용 횟수 """
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages = 0
+
+
+# 미리 띄워 둔 크롬을 빌려 쓰고 돌려받는 브라우저 풀
+# - size      : 동시에 띄울 최대 크롬 개수 (= 동시에 크롤링할 페이지 수)
+# - max_pages : 크롬 한 개로 처리할 최대 페이지 수 (넘으면 종료 후 새로 띄움, 메모리 누수 방지)
+class BrowserPool:
+    def __init__(self, size=2, max_pages=50, headless=True, warm=False):
+        self.size = size
+        self.max_pages = max_pages
+        self.headless = headless
+        self.idle = []  # 최근에 쓴 (캐시가 따뜻한) 크롬부터 재사용 (LIFO)
+        self.created = 0  # 띄웠거나 띄우는 중인 크롬 수 (🔥 확인과 같은 잠금 안에서 자리 예약 → size 초과 X)
+        self.available = threading.Condition()  # 반납/폐기될 때 기다리는 스레드를 깨움
+        self.closed = False
+
+        if warm:
+            for _ in range(size):
+                with self.available:
+                    self.created += 1
+                self.idle.append(self._create())
+
+    # 예약해 둔 자리에 크롬 생성 (실패하면 자리 반환 후 다른 대기자를 깨움)
+    def _create(self):
+        try:
+            return PooledBrowser(driver(headless=self.headless))
+        except Exception:
+            self._free_slot()
+            raise
+
+    def _free_slot(self):
+        with self.available:
+            self.created -= 1
+            self.available.notify()  # 🔥 자리가 비었으니 기다리던 스레드가 새로 띄울 수 있음
+
+    def _discard(self, pooled):
+        self._free_slot()
+        try:
+            pooled.browser.quit()
+        except WebDriverException:
+            pass
+
+    # 크롬이 아직 응답하는지 확인 (창이 닫혔거나 세션이 끊기면 False)
+    @staticmethod
+    def is_healthy(pooled):
+        try:
+            pooled.browser.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    # 풀에서 크롬 한 개 빌리기 (여유가 없으면 반납/폐기될 때까지 대기, timeout 이 지나면 queue.Empty)
+    def lease(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.available:
+                while not self.idle and self.created >= self.size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise queue.Empty
+                    self.available.wait(remaining)
+                pooled = self.idle.pop() if self.idle else None
+                if pooled is None:
+                    self.created += 1  # 🔥 여유 확인과 같은 잠금 안에서 자리 예약
+
+            if pooled is None:
+                return self._create()
+            if self.is_healthy(pooled):
+                return pooled
+            print("⚠️ 응답 없는 브라우저 폐기 후 새로 생성")
+            self._discard(pooled)
+
+    # 크롬 반납 (오류가 났거나 max_pages 를 넘으면 종료)
+    def release(self, pooled, broken=False):
+        pooled.pages += 1
+        if broken or self.closed or pooled.pages >= self.max_pages:
+            self._discard(pooled)
+            return
+        with self.available:
+            self.idle.append(pooled)
+            self.available.notify()
+
+    @contextmanager
+    def browser(self, timeout=None):
+        pooled = self.lease(timeout)
+        broken = False
+        try:
+            yield pooled.browser
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(pooled, broken=broken)
+
+    # 여러 작업을 풀 크기만큼 동시에 실행 (func(browser, item) 결과를 순서대로 반환)
+    def map(self, func, items):
+        def run(item):
+            with self.browser() as browser:
+                return func(browser, item)
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, items))
+
+    def close(self):
+        self.closed = True
+        with self.available:
+            idle, self.idle = self.idle, []
+        for pooled in idle:
+            self._discard(pooled)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# 프로세스 안에서 같이 쓰는 기본 풀
+_shared_pool = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool(size=2, max_pages=50, headless=True):
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None or _shared_pool.closed:
+            _shared_pool = BrowserPool(size=size, max_pages=max_pages, headless=headless)
+        return _shared_pool
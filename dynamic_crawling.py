@@ -8,12 +8,19 @@ from selenium.webdriver.common.by import By
 import time
 import pandas as pd
 import warnings
+from functools import lru_cache
 
 warnings.filterwarnings('ignore')
 
 
+# 크롬 드라이버 실행 파일 경로 (프로세스당 한 번만 확인/다운로드)
+@lru_cache(maxsize=1)
+def chrome_driver_path():
+    return ChromeDriverManager().install()
+
+
 # 서비스 환경별 크롬 드라이버 설정
-def driver():
+def driver(headless=False):
     userAgent = generate_user_agent()
     user_agent = parse(userAgent)
 
@@ -35,8 +42,11 @@ def driver():
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-browser-side-navigation")
     chrome_options.add_argument("--mute-audio")
+    if headless:
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--window-size=1920x1080")
 
     # 크롬 드라이버 실행
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    driver = webdriver.Chrome(service=Service(chrome_driver_path()), options=chrome_options)
     driver.implicitly_wait(3)
     return driver
@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import aiohttp
+from datetime import datetime
+from stock_master import StockMaster
+
+# 🔥 sys.path 추가하여 crawling 경로의 공용 모듈(metrics) 사용
+sys.path.append("..")
+from metrics import metrics
+
+# ✅ FinUp 뉴스 API (post_app.json 을 받은 요청과 같은 형식, 환경변수로 주소 변경 가능)
+FINUP_NEWS_URL = os.environ.get("FINUP_NEWS_URL", "https://www.finup.co.kr/api/news")
+RAW_DIR = "data/news_raw"  # ✅ {종목코드}.{수집시각}.json 으로 저장 → crawl_finup_news.py 가 정제
+CHECKPOINT_PATH = os.path.join(RAW_DIR, "_checkpoint.json")
+CONCURRENCY = 16  # ✅ 동시에 요청할 종목 수
+REFETCH_INTERVAL = 3600  # ✅ 마지막 수집 후 이 시간(초)이 안 지난 종목은 건너뜀 (중단 후 재시작 시 이어서)
+CHECKPOINT_EVERY = 50  # ✅ 이 개수만큼 종목을 처리할 때마다 체크포인트 저장
+MAX_RETRIES = 3
+PAGE_SIZE = 30
+MAX_PAGES = 100  # ✅ 종목 하나에서 한 번에 요청할 최대 페이지 수 (첫 수집 시 과거 기사 전체)
+
+
+# ✅ 체크포인트: 종목코드 → {"last_publish_dt": 마지막으로 본 PublishDT, "fetched_at": 수집 시각(epoch)}
+def load_checkpoint(path=CHECKPOINT_PATH):
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_checkpoint(checkpoint, path=CHECKPOINT_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(tmp_path, path)  # 🔥 저장 도중 중단돼도 기존 체크포인트는 깨지지 않음
+
+
+class FinupNewsCollector:
+    """ 전 종목 뉴스를 비동기로 동시에 요청하고, 종목별 마지막 PublishDT 이후 기사만 저장하는 수집기 """
+
+    def __init__(self, url=FINUP_NEWS_URL, concurrency=CONCURRENCY, raw_dir=RAW_DIR,
+                 checkpoint_path=CHECKPOINT_PATH, refetch_interval=REFETCH_INTERVAL, page_size=PAGE_SIZE):
+        self.url = url
+        self.concurrency = concurrency
+        self.raw_dir = raw_dir
+        self.checkpoint_path = checkpoint_path
+        self.refetch_interval = refetch_interval
+        self.page_size = page_size
+        self.checkpoint = load_checkpoint(checkpoint_path)
+        self.done = 0
+        self.new_items = 0
+        self.failed = []
+
+    # ✅ 페이지 하나 요청 (마지막으로 본 PublishDT 이후만 요청, 실패 시 지수 백오프 재시도)
+    async def fetch_page(self, session, stock_code, since, page):
+        payload = {"ItemCode": stock_code, "PageNo": page, "PageSize": self.page_size, "StartDT": since or ""}
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                with metrics.stage("fetch"):
+                    async with session.post(self.url, json=payload) as response:
+                        response.raise_for_status()
+                        return await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                metrics.count("fetch_errors")
+                if attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(2 ** attempt + random.uniform(0, 1))
+
+    # ✅ 종목 하나의 새 기사 전체 요청 (페이지가 덜 차거나 since 이전 기사가 나올 때까지 다음 페이지)
+    #    → 응답 형식 그대로 Result = [뉴스 목록, 키워드 목록] 을 페이지별로 이어 붙여 반환
+    async def fetch_stock(self, session, stock_code, since):
+        response, news, keywords = None, [], []
+        for page in range(1, MAX_PAGES + 1):
+            response = await self.fetch_page(session, stock_code, since, page)
+            result = response.get("Result") or [[]]
+            items = result[0]
+            news.extend(items)
+            keywords.extend(result[1] if len(result) > 1 else [])
+            if len(items) < self.page_size or any(since and item.get("PublishDT", "") <= since for item in items):
+                break
+        else:
+            print(f"⚠️ {stock_code}: {MAX_PAGES} 페이지까지만 수집 (이후 기사는 다음 실행에서 수집되지 않음)")
+        metrics.count("pages", page)
+        return dict(response, Result=[news, keywords])
+
+    @metrics.timed("write")
+    def save_response(self, stock_code, response, news):
+        os.makedirs(self.raw_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        path = os.path.join(self.raw_dir, f"{stock_code}.{stamp}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dict(response, Result=[news] + response["Result"][1:]), f, ensure_ascii=False)
+
+    async def collect_stock(self, session, semaphore, stock_code):
+        state = self.checkpoint.get(stock_code, {})
+        if time.time() - state.get("fetched_at", 0) < self.refetch_interval:
+            return  # ✅ 이번 실행(또는 최근 실행)에서 이미 수집한 종목
+
+        async with semaphore:
+            since = state.get("last_publish_dt")
+            try:
+                response = await self.fetch_stock(session, stock_code, since)
+            except Exception as e:
+                print(f"⛔ {stock_code} 수집 실패: {e}")
+                self.failed.append(stock_code)
+                return
+
+        # 🔥 서버가 StartDT 를 무시해도 이미 본 기사는 저장하지 않음
+        #    체크포인트는 모든 페이지를 받은 뒤에만 갱신 (중간에 실패하면 다음 실행에서 처음부터 다시 요청)
+        news = [item for item in response["Result"][0] if not since or item.get("PublishDT", "") > since]
+        if news:
+            self.save_response(stock_code, response, news)
+            self.new_items += len(news)
+        metrics.count("stocks")
+        metrics.count("news", len(news))
+
+        self.checkpoint[stock_code] = {
+            "last_publish_dt": max([item.get("PublishDT", "") for item in news] + [since or ""]),
+            "fetched_at": time.time(),
+        }
+        self.done += 1
+        if self.done % CHECKPOINT_EVERY == 0:
+            save_checkpoint(self.checkpoint, self.checkpoint_path)
+
+    async def run(self, stock_codes):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=30)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        start = time.perf_counter()
+
+        try:
+            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+                await asyncio.gather(*(self.collect_stock(session, semaphore, code) for code in stock_codes))
+        finally:
+            save_checkpoint(self.checkpoint, self.checkpoint_path)
+
+        elapsed = time.perf_counter() - start
+        print(f"✅ {self.done}개 종목 수집, 새 뉴스 {self.new_items}개, 실패 {len(self.failed)}개 "
+              f"({elapsed:.1f}초, {self.done / elapsed if elapsed else 0:.1f} 종목/초)")
+        return self.done
+
+
+if __name__ == "__main__":
+    asyncio.run(FinupNewsCollector().run(StockMaster.load().codes))
+    metrics.report()
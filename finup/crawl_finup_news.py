@@ -1,43 +1,231 @@
+import os
+import sys
 import json
-import time
+import glob
+import ijson
+from collections import OrderedDict
+from stock_master import StockMaster
 
-# ✅ 테스트용: 파일 불러오기
-with open("data/post_app.json", "r", encoding="utf-8") as f:
-    raw_data = json.load(f)
+# 🔥 sys.path 추가하여 crawling 경로의 공용 모듈(text_tokenizer, near_duplicates) 사용
+sys.path.append("..")
+from text_tokenizer import Tokenizer
+from near_duplicates import NearDuplicateIndex
+from metrics import metrics
 
-# ✅ 뉴스 리스트 추출
-news_items = raw_data["Result"][0]
+# ✅ 입력/출력 경로
+RAW_DIR = "data/news_raw"  # ✅ 종목별 FinUp 응답 ({종목코드}.json 또는 collect_finup_news.py 가 저장한 {종목코드}.{수집시각}.json)
+LEGACY_RAW_PATH = "data/post_app.json"  # ✅ 테스트용으로 저장해 둔 응답 (자이언트스텝)
+LEGACY_STOCK_CODE = "289220"
+OUTPUT_DIR = "data/news_jsonl"  # ✅ {종목코드}/{날짜}.jsonl 로 이어 쓰기
+PROCESSED_FILE = "_processed.json"  # ✅ 이미 처리한 응답 파일 기록 (OUTPUT_DIR 안)
+DEDUP_FILE = "_near_duplicates.pkl"  # ✅ 근접 중복 탐지 색인 (OUTPUT_DIR 안, 종목코드별로 비교)
+MAX_OPEN_FILES = 64
 
-# ✅ 종목 정보 (예시)
-stock_name = "자이언트스텝"
-stock_code = "289220"
-market = "KOSDAQ"
 
-# ✅ 정제된 리스트로 가공
-cleaned_news = []
-for item in news_items:
+# ✅ 종목 리스트 (종목코드 → 종목명/시장구분), Parquet 캐시(stock_master.py)의 dict 인덱스 사용
+def load_stock_index(master):
+    return {
+        code: {"종목명": stock["회사명"], "시장구분": stock["시장구분"]}
+        for code, stock in master.by_code.items()
+    }
+
+
+# ✅ 응답 JSON 에서 뉴스 항목(Result[0] 의 원소)만 하나씩 꺼냄
+#    Result[1] 은 뉴스별 키워드 목록이라 건너뜀
+def iter_news_items(f):
+    list_no = -1
+    builder = None
+    depth = 0
+
+    for prefix, event, value in ijson.parse(f):
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+                if depth == 0:
+                    yield builder.value
+                    builder = None
+            continue
+
+        if prefix == "Result.item" and event == "start_array":
+            list_no += 1
+        elif prefix == "Result.item.item" and event == "start_map" and list_no == 0:
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            depth = 1
+
+
+# ✅ 뉴스 항목 → 저장 형식 (tagger 가 있으면 제목/요약에 나온 다른 종목도 "관련종목" 으로 저장)
+def clean_news_item(item, stock_code, stock, tagger=None):
     media_name = item.get("MediaName", "")
 
     if not media_name:
         print(f"⚠️ 언론사 없음: {item.get('Title', '')[:30]}...")
 
-    cleaned_news.append({
-        "종목명": stock_name,
+    record = {
+        "종목명": stock["종목명"],
         "종목코드": stock_code,
-        "시장구분": market,
+        "시장구분": stock["시장구분"],
         "날짜": item.get("PublishDT", "unknown"),
         "제목": item.get("Title", ""),
         "url": item.get("Url", ""),
         "요약": item.get("Summary", ""),
         "언론사": media_name,
         "감성라벨": "unknown"
-    })
+    }
+    if tagger is not None:
+        tagger.tag([record], ("제목", "요약"), "관련종목")
+    return record
+
+
+# ✅ 저장된 뉴스를 구분하는 키 (URL, 없으면 제목 + 날짜)
+def record_key(record):
+    return record.get("url") or f"{record.get('제목', '')}|{record.get('날짜', '')}"
+
+
+class JsonlPartitionWriter:
+    """ {종목코드}/{날짜}.jsonl 파일에 한 줄씩 이어 쓰기 (열어 둔 파일 수 제한)
+        🔥 파일에 이미 있는 뉴스(record_key 기준)는 다시 쓰지 않음 → 중간에 실패한 응답 파일을 다시 처리해도 중복 없음 """
+
+    def __init__(self, output_dir=OUTPUT_DIR, max_open_files=MAX_OPEN_FILES):
+        self.output_dir = output_dir
+        self.max_open_files = max_open_files
+        self.files = OrderedDict()
+        self.keys = {}  # ✅ 파일 경로 → 저장된 뉴스 키 (처음 쓸 때 한 번만 읽음)
+        self.written = 0
+
+    # ✅ 파일에 저장된 뉴스 키 (쓰다 끊긴 마지막 줄은 잘라내고 다시 씀)
+    @staticmethod
+    def read_keys(path):
+        keys = set()
+        if not os.path.exists(path):
+            return keys
+        with open(path, "r+b") as f:
+            offset = 0
+            for line in f:
+                if not line.endswith(b"\n"):
+                    print(f"⚠️ 마지막 줄이 끊긴 파일 → 잘라냄: {path}")
+                    f.truncate(offset)
+                    break
+                keys.add(record_key(json.loads(line)))
+                offset += len(line)
+        return keys
+
+    # ✅ 한 줄 쓰기 (이미 저장된 뉴스면 False)
+    def write(self, record):
+        date = str(record["날짜"])[:10] or "unknown"
+        path = os.path.join(self.output_dir, record["종목코드"], f"{date}.jsonl")
+
+        keys = self.keys.get(path)
+        if keys is None:
+            keys = self.keys[path] = self.read_keys(path)
+        key = record_key(record)
+        if key in keys:
+            return False
+        keys.add(key)
+
+        f = self.files.pop(path, None)
+        if f is None:
+            if len(self.files) >= self.max_open_files:
+                self.files.popitem(last=False)[1].close()  # 🔥 가장 오래 안 쓴 파일 닫기
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            f = open(path, "a", encoding="utf-8")
+        self.files[path] = f
+
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.written += 1
+        return True
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+        self.files.clear()
+
+
+# ✅ 처리할 응답 파일 목록 (종목코드, 경로)
+def find_raw_files(raw_dir=RAW_DIR):
+    raw_files = [(os.path.basename(path).split(".")[0], path)
+                 for path in sorted(glob.glob(os.path.join(raw_dir, "*.json")))
+                 if not os.path.basename(path).startswith("_")]  # 🔥 _checkpoint.json 제외
+    if os.path.exists(LEGACY_RAW_PATH):
+        raw_files.append((LEGACY_STOCK_CODE, LEGACY_RAW_PATH))
+    return raw_files
+
+
+def load_processed(path):
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_processed(processed, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(processed, f, ensure_ascii=False)
+
+
+# ✅ 제목/요약 명사 (근접 중복 탐지용)
+def news_nouns(record, tokenizer):
+    with metrics.stage("mecab"):
+        return tokenizer.nouns(record["제목"]) + tokenizer.nouns(record["요약"])
+
+
+# ✅ 모든 종목 응답을 스트리밍으로 정제해 JSON Lines 로 저장 (이미 처리한 파일은 건너뜀)
+#    같은 종목에서 URL 만 다른 근접 중복 기사(통신사 기사 재전송 등)는 저장하지 않음
+def process_all(raw_files=None, master=None, output_dir=OUTPUT_DIR, tokenizer=None):
+    master = master or StockMaster.load()
+    stock_index = load_stock_index(master)
+    raw_files = raw_files if raw_files is not None else find_raw_files()
+    processed_path = os.path.join(output_dir, PROCESSED_FILE)
+    processed = load_processed(processed_path)
+    writer = JsonlPartitionWriter(output_dir)
+    tokenizer = tokenizer or Tokenizer()
+    dedup_index = NearDuplicateIndex(os.path.join(output_dir, DEDUP_FILE)).load()
+
+    try:
+        for stock_code, path in raw_files:
+            stamp = f"{os.path.getsize(path)}:{os.path.getmtime(path)}"
+            if processed.get(path) == stamp:
+                continue
+
+            stock = stock_index.get(stock_code)
+            if stock is None:
+                print(f"⚠️ 종목 리스트에 없는 종목코드: {stock_code} ({path})")
+                continue
+
+            count = skipped = existing = 0
+            with open(path, "rb") as f:
+                for item in iter_news_items(f):
+                    with metrics.stage("clean"):
+                        record = clean_news_item(item, stock_code, stock, master.tagger)
+                    with metrics.stage("dedup"):
+                        kept, _ = dedup_index.dedupe([record], lambda news: news_nouns(news, tokenizer),
+                                                     lambda news: news["url"], lambda news: news["종목코드"])
+                    if not kept:
+                        skipped += 1
+                        continue
+                    with metrics.stage("write"):
+                        if not writer.write(record):
+                            existing += 1
+                            continue
+                    count += 1
+            processed[path] = stamp
+            metrics.count("news", count)
+            metrics.count("duplicates", skipped)
+            print(f"✅ {stock['종목명']}({stock_code}): 뉴스 {count}개 "
+                  f"(근접 중복 {skipped}개, 이미 저장된 뉴스 {existing}개 제외)")
+    finally:
+        writer.close()
+        save_processed(processed, processed_path)
+        dedup_index.save()
 
-# ✅ 저장 전 약간의 딜레이 (예: 파일 I/O 전 서버 안정용)
-time.sleep(0.5)
+    print(f"✅ 저장 완료: {output_dir} (뉴스 {writer.written}개)")
+    return writer.written
 
-# ✅ 결과 저장
-with open("data/finup_news_cleaned.json", "w", encoding="utf-8") as f:
-    json.dump(cleaned_news, f, ensure_ascii=False, indent=2)
 
-print("✅ 저장 완료: data/finup_news_cleaned.json")
+if __name__ == "__main__":
+    process_all()
+    metrics.report()
@@ -8,26 +8,42 @@ import json
 import os
 from io import StringIO
 
-def get_all_stock_codes():
-    url = 'https://kind.krx.co.kr/corpgeneral/corpList.do?method=download'
+KRX_LIST_URL = 'https://kind.krx.co.kr/corpgeneral/corpList.do?method=download'
+
+# 시장별 다운로드 (marketType) → 시장구분은 종목코드로 유추하지 않고 KRX 시장별 목록에서 가져옴
+MARKET_TYPES = {'KOSPI': 'stockMkt', 'KOSDAQ': 'kosdaqMkt', 'KONEX': 'konexMkt'}
+UNKNOWN_MARKET = '기타'
+
+def market_list_url(market, url=KRX_LIST_URL):
+    return f'{url}&marketType={MARKET_TYPES[market]}'
+
+def download_list(url):
     res = requests.get(url)
     res.encoding = 'euc-kr'
+    return res.text
 
-    html = StringIO(res.text)
+def get_all_stock_codes():
+    df = parse_stock_list(download_list(KRX_LIST_URL))
+    markets = {market: parse_stock_list(download_list(market_list_url(market))) for market in MARKET_TYPES}
+    return resolve_markets(df, markets)
+
+def parse_stock_list(text):
+    html = StringIO(text)
     df = pd.read_html(html)[0]
 
-    df = df[['회사명', '종목코드']]
-    df['종목코드'] = df['종목코드'].apply(lambda x: str(x).zfill(6))
+    df = df[['회사명', '종목코드']].copy()
+    df['종목코드'] = df['종목코드'].astype(str).str.strip().str.zfill(6)  # 🔥 행별 apply 대신 벡터 연산
+    return df
 
-    # 종목코드로 시장구분 유추
-    def infer_market(code):
-        code_int = int(code)
-        if code_int >= 100000:
-            return "KOSDAQ"
-        else:
-            return "KOSPI"
+# 시장별 목록과 종목코드로 merge 해서 시장구분 부여 (어느 시장에도 없으면 '기타')
+def resolve_markets(df, markets):
+    market_df = pd.concat(
+        [market_list[['종목코드']].assign(시장구분=market) for market, market_list in markets.items()],
+        ignore_index=True,
+    ).drop_duplicates('종목코드')
 
-    df['시장구분'] = df['종목코드'].apply(infer_market)
+    df = df.drop(columns='시장구분', errors='ignore').merge(market_df, on='종목코드', how='left')
+    df['시장구분'] = df['시장구분'].fillna(UNKNOWN_MARKET)
     return df
 
 def save_stock_codes_to_json(df, save_path='data/stock_list.json'):
@@ -0,0 +1,66 @@
+import json
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# ✅ FinUp 뉴스 API 를 흉내 내는 로컬 서버 (저장해 둔 post_app.json 응답을 모든 종목에 재사용)
+#   실제 API 에 요청하지 않고 collect_finup_news.py 의 처리량을 측정할 때 사용
+#   사용법: python mock_finup_server.py → FINUP_NEWS_URL=http://127.0.0.1:8766/news python collect_finup_news.py
+SAMPLE_PATH = "data/post_app.json"
+LATENCY = 0.05  # ✅ 응답 지연 (초) - 실제 API 처럼 네트워크 대기를 흉내 냄
+
+
+def load_sample(path=SAMPLE_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def make_handler(sample, latency):
+    class MockFinupHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                self.send_error(400)
+                return
+
+            # 🔥 StartDT 이후 기사를 최신순으로 PageNo/PageSize 만큼 돌려줌 (조건부 재요청/페이지 넘김 확인용)
+            start_dt = payload.get("StartDT") or ""
+            page, page_size = int(payload.get("PageNo") or 1), int(payload.get("PageSize") or 30)
+            news = sorted((item for item in sample["Result"][0] if item.get("PublishDT", "") > start_dt),
+                          key=lambda item: item.get("PublishDT", ""), reverse=True)
+            news = news[(page - 1) * page_size:page * page_size]
+            object_ids = {item.get("ObjectId") for item in news}
+            keywords = [keyword for keyword in sample["Result"][1] if keyword.get("ObjectId") in object_ids]
+            response = dict(sample, Result=[news, keywords])
+
+            time.sleep(latency)
+            body = json.dumps(response, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MockFinupHandler
+
+
+def start_server(host="127.0.0.1", port=0, latency=LATENCY, sample=None):
+    """ 백그라운드 스레드로 서버 시작 → (server, 뉴스 API URL) 반환 (port=0 이면 빈 포트 자동 선택) """
+    server = ThreadingHTTPServer((host, port), make_handler(sample or load_sample(), latency))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/news"
+
+
+if __name__ == "__main__":
+    server, url = start_server(port=8766)
+    print(f"✅ FinUp 뉴스 목 서버 실행: {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,127 @@
+import os
+import sys
+import json
+import time
+import requests
+import pandas as pd
+from getAllStockCodes import KRX_LIST_URL, MARKET_TYPES, market_list_url, parse_stock_list, resolve_markets
+
+# ✅ 다른 폴더(yunhap 등)에서 import 해도 같은 캐시를 쓰도록 경로는 이 파일 기준
+FINUP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 🔥 sys.path 추가하여 crawling 경로의 공용 모듈(mention_tagger, metrics) 사용
+sys.path.append(os.path.join(FINUP_DIR, ".."))
+from mention_tagger import stock_tagger
+from metrics import metrics
+
+# ✅ 종목 마스터 캐시 (다운로드별 Parquet + 재검증용 메타데이터)
+#   - data/cache/stock_list.parquet: 전체 목록 / data/cache/market_{KOSPI,KOSDAQ,KONEX}.parquet: 시장별 목록
+CACHE_DIR = os.path.join(FINUP_DIR, "data", "cache")
+FALLBACK_JSON = os.path.join(FINUP_DIR, "data", "stock_list.json")  # ✅ 네트워크가 안 될 때 사용할 기존 JSON
+TTL = 24 * 3600  # ✅ 이 시간(초) 안에는 KRX 에 다시 묻지 않음
+
+
+def load_meta(path):
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_meta(meta, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+
+# ✅ KRX 목록 하나를 캐시에서 로드 (TTL 이 지났으면 ETag/Last-Modified 로 재검증, 바뀌었을 때만 다시 다운로드)
+#    요청이 실패하면 캐시, 캐시도 없으면 None
+def cached_list(name, url, ttl=TTL, cache_dir=CACHE_DIR):
+    cache_path = os.path.join(cache_dir, f"{name}.parquet")
+    meta_path = os.path.join(cache_dir, f"{name}.meta.json")
+    meta = load_meta(meta_path)
+    cached = os.path.exists(cache_path)
+
+    if cached and time.time() - meta.get("fetched_at", 0) < ttl:
+        return pd.read_parquet(cache_path)
+
+    headers = {}
+    if cached and meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if cached and meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        with metrics.stage("krx_fetch"):
+            res = requests.get(url, headers=headers, timeout=30)
+        res.raise_for_status()
+    except requests.RequestException as e:
+        print(f"⚠️ KRX {name} 요청 실패: {e}")
+        return pd.read_parquet(cache_path) if cached else None
+
+    if res.status_code == 304 and cached:
+        print(f"✅ {name} 변경 없음 (304) → 캐시 사용")
+        df = pd.read_parquet(cache_path)
+    else:
+        res.encoding = "euc-kr"
+        df = parse_stock_list(res.text)
+        os.makedirs(cache_dir, exist_ok=True)
+        df.to_parquet(cache_path, index=False)
+        print(f"✅ {name} 캐시 저장: {cache_path} ({len(df)}개)")
+
+    save_meta({
+        "etag": res.headers.get("ETag"),
+        "last_modified": res.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+    }, meta_path)
+    return df
+
+
+class StockMaster:
+    """ KRX 종목 리스트 + 종목코드/회사명 dict 인덱스 + 기사 본문 종목명 매칭 """
+
+    def __init__(self, df):
+        self.df = df.reset_index(drop=True)
+        records = self.df.to_dict(orient="records")
+        self.by_code = {record["종목코드"]: record for record in records}
+        self.by_name = {record["회사명"]: record for record in records}
+        self._tagger = None
+
+    def __len__(self):
+        return len(self.df)
+
+    @property
+    def codes(self):
+        return list(self.by_code)
+
+    def get(self, key):
+        """ 종목코드 또는 회사명으로 조회 (없으면 None) """
+        return self.by_code.get(key) or self.by_name.get(key)
+
+    # ✅ 종목명 Aho-Corasick 태거 (처음 쓸 때 한 번만 생성)
+    @property
+    def tagger(self):
+        if self._tagger is None:
+            self._tagger = stock_tagger(self.by_code.values())
+        return self._tagger
+
+    # ✅ 기사에 나온 종목 찾기 → [{종목코드, 종목명, 시장구분}, ...]
+    def find_mentions(self, text):
+        return self.tagger.find(text)
+
+    # ✅ 전체 목록 + 시장별 목록(캐시)을 종목코드로 merge 해서 시장구분 확정
+    @classmethod
+    def load(cls, ttl=TTL, cache_dir=CACHE_DIR, url=KRX_LIST_URL):
+        df = cached_list("stock_list", url, ttl, cache_dir)
+        markets = {market: cached_list(f"market_{market}", market_list_url(market, url), ttl, cache_dir)
+                   for market in MARKET_TYPES}
+
+        if df is None or any(market_list is None for market_list in markets.values()):
+            print(f"⚠️ KRX 목록을 받지 못해 {FALLBACK_JSON} 사용")
+            return cls.from_json(FALLBACK_JSON)
+        return cls(resolve_markets(df, markets))
+
+    @classmethod
+    def from_json(cls, path=FALLBACK_JSON):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(pd.DataFrame(json.load(f)))
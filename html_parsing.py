@@ -0,0 +1,121 @@
+import os
+from bs4 import BeautifulSoup
+
+# 빠른 파서는 설치돼 있을 때만 사용 (없으면 BeautifulSoup html.parser)
+try:
+    import lxml.html
+    import cssselect  # lxml 의 CSS 선택자 지원에 필요
+except ImportError:
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+
+# 같은 CSS 선택자를 어떤 파서에서든 쓸 수 있게 감싼 노드
+# - select(css) / select_one(css) / text(strip) / get(attr)
+class SoupNode:
+    def __init__(self, tag):
+        self.tag = tag
+
+    def select(self, css):
+        return [SoupNode(tag) for tag in self.tag.select(css)]
+
+    def select_one(self, css):
+        tag = self.tag.select_one(css)
+        return SoupNode(tag) if tag is not None else None
+
+    def text(self, strip=False):
+        return self.tag.get_text(strip=strip)
+
+    def get(self, attr, default=None):
+        return self.tag.get(attr, default)
+
+
+class LxmlNode:
+    def __init__(self, element):
+        self.element = element
+
+    def select(self, css):
+        return [LxmlNode(element) for element in self.element.cssselect(css)]
+
+    def select_one(self, css):
+        found = self.element.cssselect(css)
+        return LxmlNode(found[0]) if found else None
+
+    def text(self, strip=False):
+        if strip:
+            return "".join(s.strip() for s in self.element.itertext())
+        return "".join(self.element.itertext())
+
+    def get(self, attr, default=None):
+        return self.element.get(attr, default)
+
+
+class SelectolaxNode:
+    def __init__(self, node):
+        self.node = node
+
+    def select(self, css):
+        return [SelectolaxNode(node) for node in self.node.css(css)]
+
+    def select_one(self, css):
+        node = self.node.css_first(css)
+        return SelectolaxNode(node) if node is not None else None
+
+    def text(self, strip=False):
+        return self.node.text(deep=True, separator="", strip=strip)
+
+    def get(self, attr, default=None):
+        value = self.node.attributes.get(attr, default)
+        return default if value is None else value
+
+
+# 파서 이름 → 파싱 함수
+def _parse_soup(html, builder):
+    return SoupNode(BeautifulSoup(html, builder))
+
+
+BACKENDS = {"html.parser": lambda html: _parse_soup(html, "html.parser")}
+if lxml is not None:
+    BACKENDS["bs4-lxml"] = lambda html: _parse_soup(html, "lxml")
+    BACKENDS["lxml"] = lambda html: LxmlNode(lxml.html.document_fromstring(html))
+if HTMLParser is not None:
+    BACKENDS["selectolax"] = lambda html: SelectolaxNode(HTMLParser(html))
+
+
+# 기본 파서: 환경변수 HTML_PARSER 로 지정, 없으면 설치된 것 중 가장 빠른 것
+def default_backend():
+    name = os.environ.get("HTML_PARSER")
+    if name:
+        return name
+    for name in ("selectolax", "lxml", "html.parser"):
+        if name in BACKENDS:
+            return name
+
+
+# 필요한 부분(start_marker ~ end_marker)만 잘라서 파싱할 문자열 반환 (못 찾으면 전체)
+def extract_subtree(html, start_marker, end_marker=None):
+    start = html.find(start_marker)
+    if start < 0:
+        return html
+    start = html.rfind("<", 0, start + 1)
+    if end_marker is None:
+        return html[start:]
+    end = html.find(end_marker, start)
+    return html[start:end + len(end_marker)] if end >= 0 else html[start:]
+
+
+def parse_html(html, backend=None, subtree=None):
+    """ HTML → 공통 노드 (subtree=(시작 표시, 끝 표시) 를 주면 그 구간만 파싱) """
+    if subtree:
+        html = extract_subtree(html, *subtree)
+    name = backend or default_backend()
+    if name not in BACKENDS:
+        raise ValueError(f"사용할 수 없는 파서: {name} (가능: {', '.join(BACKENDS)})")
+    return BACKENDS[name](html)
@@ -0,0 +1,154 @@
+from collections import deque
+
+# pyahocorasick 이 설치돼 있으면 C 구현 사용 (없으면 아래 순수 파이썬 오토마타)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# ✅ 한글 이름 바로 뒤에 붙어도 되는 조사/의존명사 ("자이언트스텝은", "대웅제약과", "라이프시맨틱스등")
+PARTICLES = ("으로", "에서", "에게", "까지", "부터", "보다", "처럼", "이나", "이랑",
+             "은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "도", "만", "로", "랑", "등", "측")
+
+# ✅ 일반 단어와 같은 회사명 → 종목코드/주가 표기("대상[001680]", "NEW(-5.59%)", "대상㈜")가 바로 뒤에 올 때만 태깅
+COMMON_WORD_NAMES = frozenset([
+    "대상", "레이", "디오", "아하", "대동", "노을", "나노", "레몬", "남성", "동방", "동서", "동양", "태양", "전방",
+    "국보", "씨앗", "코디", "핑거", "캐리", "배럴", "진도", "서산", "보령", "카스", "유니온", "아이엠", "NEW", "NICE",
+])
+COMMON_WORD_SUFFIXES = ("[", "(", "㈜")
+
+
+def is_ascii_word(char):
+    return char.isascii() and char.isalnum()
+
+
+def is_hangul(char):
+    return "가" <= char <= "힣"
+
+
+# 🔥 "ㆍ"(아래아, 가운뎃점 대신 자주 씀) 는 isalnum() 이 True 라서 따로 제외
+def is_word_char(char):
+    return char.isalnum() and char != "ㆍ"
+
+
+# ✅ 순수 파이썬 Aho-Corasick 오토마타 (이름 수와 상관없이 본문을 한 번만 훑음)
+class Automaton:
+    def __init__(self, words):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        for word_id, word in enumerate(words):
+            node = 0
+            for char in word:
+                next_node = self.goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self.goto)
+                    self.goto[node][char] = next_node
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                node = next_node
+            self.out[node].append(word_id)
+
+        # 🔥 BFS 로 실패 링크 연결 + 실패 링크 쪽 출력 합치기
+        queue = deque(self.goto[0].values())  # 루트 바로 아래 노드의 실패 링크는 루트(0)
+        while queue:
+            node = queue.popleft()
+            for char, next_node in self.goto[node].items():
+                queue.append(next_node)
+                fail = self.fail[node]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[next_node] = self.goto[fail].get(char, 0)
+                self.out[next_node] = self.out[next_node] + self.out[self.fail[next_node]]
+
+    def iter(self, text):
+        """ (끝 위치, 단어 번호) 를 본문 순서대로 반환 """
+        goto, fail, out = self.goto, self.fail, self.out
+        node = 0
+        for end, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for word_id in out[node]:
+                yield end, word_id
+
+
+class MentionTagger:
+    """ 이름 → 정보(dict) 사전으로 본문에 나온 이름을 한 번에 찾는 태거
+        - 겹치면 먼저 시작하고 더 긴 이름 우선 ("삼성전자우" 안의 "삼성전자" 는 무시)
+        - 영문/숫자 이름은 앞뒤가 영문/숫자면 무시 ("SK" ⊂ "SKT")
+        - 한글 이름은 앞이 글자(한글/영문/숫자)면 무시, 뒤는 글자가 아니거나 조사일 때만 인정
+          ("스튜디오" 안의 "디오", "하이브아이엠" 안의 "하이브"/"아이엠" 은 무시, "자이언트스텝은" 은 인정)
+        - ambiguous 에 있는 이름(일반 단어)은 뒤에 종목코드/주가 표기가 붙은 경우만 인정 """
+
+    def __init__(self, entries, ambiguous=()):
+        self.words = list(entries)
+        self.payloads = [entries[word] for word in self.words]
+        self.ambiguous = [word in ambiguous for word in self.words]
+
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for word_id, word in enumerate(self.words):
+                self.automaton.add_word(word, word_id)
+            self.automaton.make_automaton()
+        else:
+            self.automaton = Automaton(self.words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def spans(self, text):
+        """ 본문에서 찾은 이름의 (시작, 끝, 단어 번호) 목록 """
+        if not text or not self.words:
+            return []
+
+        matches = []
+        for end, word_id in self.automaton.iter(text):
+            word = self.words[word_id]
+            start = end - len(word) + 1
+            if is_ascii_word(word[0]) and start > 0 and is_ascii_word(text[start - 1]):
+                continue
+            if is_ascii_word(word[-1]) and end + 1 < len(text) and is_ascii_word(text[end + 1]):
+                continue
+            if is_hangul(word[0]) and start > 0 and is_word_char(text[start - 1]):
+                continue
+            if (is_hangul(word[-1]) and end + 1 < len(text) and is_word_char(text[end + 1])
+                    and not text.startswith(PARTICLES, end + 1)):
+                continue
+            if self.ambiguous[word_id] and not text.startswith(COMMON_WORD_SUFFIXES, end + 1):
+                continue
+            matches.append((start, end + 1, word_id))
+
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+        spans = []
+        last_end = 0
+        for start, end, word_id in matches:
+            if start >= last_end:
+                spans.append((start, end, word_id))
+                last_end = end
+        return spans
+
+    def find(self, text):
+        """ 본문에 나온 이름의 정보 목록 (처음 나온 순서, 중복 제거) """
+        found = {}
+        for _, _, word_id in self.spans(text):
+            found.setdefault(word_id, self.payloads[word_id])
+        return list(found.values())
+
+    def tag(self, records, fields, key):
+        """ 레코드 묶음의 fields 를 함께 검색해 record[key] 에 결과 저장 """
+        for record in records:
+            text = "\n".join(str(record.get(field) or "") for field in fields)
+            record[key] = self.find(text)
+        return records
+
+
+# ✅ 종목 리스트(회사명 → 종목코드/종목명/시장구분) 로 태거 생성
+def stock_tagger(stocks):
+    return MentionTagger({
+        stock["회사명"]: {"종목코드": stock["종목코드"], "종목명": stock["회사명"], "시장구분": stock["시장구분"]}
+        for stock in stocks
+    }, ambiguous=COMMON_WORD_NAMES)
+
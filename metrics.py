@@ -0,0 +1,206 @@
+import os
+import sys
+import json
+import time
+import atexit
+import cProfile
+import threading
+from functools import wraps
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 크롤러 단계별 소요 시간/개수 측정 (fetch, render_wait, parse, clean_text, mecab, encode, db_write ...)
+# 환경변수로 내보내기/프로파일링 설정 (코드 수정 없이)
+#   METRICS_JSON=경로      : 프로세스 종료 시 단계별 통계를 JSON 으로 저장
+#   METRICS_PORT=9108      : http://127.0.0.1:9108/metrics 에서 Prometheus 텍스트 형식으로 조회
+#   METRICS_PROFILE=encode,parse : 해당 단계를 cProfile 로 측정해 PROFILE_DIR/{단계}.prof 로 저장
+#                                  (snakeviz / python -m pstats 로 확인)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PROFILE_DIR = os.environ.get("METRICS_PROFILE_DIR", "profiles")
+METRIC_PREFIX = "crawler"
+
+
+# 누적 히스토그램 (Prometheus 방식 고정 구간, 구간으로 p50/p95 추정)
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q):
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (self.max,), self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {"count": self.count, "sum": round(self.sum, 6), "max": round(self.max, 6),
+                "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+                "p50": self.quantile(0.5), "p95": self.quantile(0.95)}
+
+
+class Metrics:
+    """ 단계별 소요 시간 히스토그램 + 개수 카운터 (여러 스레드에서 기록해도 안전) """
+
+    def __init__(self, profile_stages=None, profile_dir=PROFILE_DIR):
+        self.histograms = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+        self.profile_stages = set(profile_stages or ())
+        self.profile_dir = profile_dir
+        self.profiles = {}  # 단계 → cProfile.Profile (같은 단계는 누적)
+        self.profiling = False  # 🔥 cProfile 은 동시에 하나만 켤 수 있음
+        self.started = time.time()
+
+    def observe(self, stage, seconds):
+        with self.lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram()
+            histogram.observe(seconds)
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    # 단계 하나를 감싸서 걸린 시간 기록 (profile=True 또는 METRICS_PROFILE 에 있으면 cProfile 측정)
+    @contextmanager
+    def stage(self, name, profile=False):
+        profiler = self.start_profile(name) if profile or name in self.profile_stages else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+            if profiler is not None:
+                profiler.disable()
+                with self.lock:
+                    self.profiling = False
+
+    def start_profile(self, name):
+        with self.lock:
+            if self.profiling:
+                return None  # 다른 단계를 측정 중이면 시간만 기록
+            self.profiling = True
+            profiler = self.profiles.setdefault(name, cProfile.Profile())
+        profiler.enable()
+        return profiler
+
+    # 함수 전체를 단계로 기록하는 데코레이터
+    def timed(self, name):
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "script": os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else "",
+                "started": self.started,
+                "elapsed": round(time.time() - self.started, 3),
+                "stages": {name: histogram.snapshot() for name, histogram in self.histograms.items()},
+                "counters": dict(self.counters),
+            }
+
+    # Prometheus 텍스트 형식 (crawler_stage_seconds 히스토그램 + crawler_{이름}_total 카운터)
+    def prometheus_text(self):
+        lines = [f"# TYPE {METRIC_PREFIX}_stage_seconds histogram"]
+        with self.lock:
+            for name, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{METRIC_PREFIX}_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_sum{{stage="{name}"}} {histogram.sum:.6f}')
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_count{{stage="{name}"}} {histogram.count}')
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE {METRIC_PREFIX}_{name}_total counter")
+                lines.append(f"{METRIC_PREFIX}_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+
+    def save_profiles(self):
+        paths = []
+        for name, profiler in self.profiles.items():
+            os.makedirs(self.profile_dir, exist_ok=True)
+            path = os.path.join(self.profile_dir, f"{name}.prof")
+            profiler.dump_stats(path)
+            paths.append(path)
+        return paths
+
+    # 단계별 요약 출력 (크롤링 끝에 호출)
+    def report(self):
+        snapshot = self.snapshot()
+        if not snapshot["stages"] and not snapshot["counters"]:
+            return
+        print(f"📊 단계별 소요 시간 ({snapshot['elapsed']:.1f}초 동안)")
+        for name, stats in sorted(snapshot["stages"].items(), key=lambda item: -item[1]["sum"]):
+            print(f"  {name:<14} {stats['count']:>7}회  합계 {stats['sum']:8.2f}초  "
+                  f"평균 {stats['mean'] * 1000:8.1f}ms  p95 ≤{stats['p95'] * 1000:8.1f}ms")
+        if snapshot["counters"]:
+            print("  " + ", ".join(f"{name}={value}" for name, value in sorted(snapshot["counters"].items())))
+        for path in self.save_profiles():
+            print(f"  🔬 프로파일 저장: {path}")
+
+    # /metrics (Prometheus 텍스트), /metrics.json 응답하는 로컬 HTTP 서버 (백그라운드 스레드)
+    def serve(self, port, host="127.0.0.1"):
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith("/metrics.json"):
+                    body, content_type = json.dumps(registry.snapshot()).encode("utf-8"), "application/json"
+                elif self.path.startswith("/metrics"):
+                    body, content_type = registry.prometheus_text().encode("utf-8"), "text/plain; version=0.0.4"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"📈 메트릭 서버: http://{host}:{server.server_address[1]}/metrics")
+        return server
+
+
+def configure_from_env(registry):
+    if os.environ.get("METRICS_PORT"):
+        registry.serve(int(os.environ["METRICS_PORT"]))
+    if os.environ.get("METRICS_JSON"):
+        atexit.register(lambda: registry.write_json(os.environ["METRICS_JSON"]))
+    return registry
+
+
+# 프로세스 전체에서 함께 쓰는 기본 레지스트리 (from metrics import metrics)
+metrics = configure_from_env(Metrics(
+    profile_stages=[stage for stage in os.environ.get("METRICS_PROFILE", "").split(",") if stage]))
@@ -0,0 +1,126 @@
+import os
+import pickle
+import hashlib
+import numpy as np
+
+# ✅ MinHash-LSH 근접 중복 탐지 설정
+#   - 기사 명사(제목 + 요약) 집합의 MinHash 서명 (NUM_PERM 개) → 두 서명이 같은 비율 ≈ 자카드 유사도
+#   - 서명을 BANDS 개 구간(ROWS 개씩)으로 나눠 구간별 버킷에 넣음 → 같은 버킷에 들어온 기사만 비교 (전체 비교 없음)
+#     BANDS=16, ROWS=4 이면 유사도 0.7 인 기사는 약 98%, 0.3 인 기사는 약 12% 확률로 후보가 됨
+#   - 후보 중 추정 유사도가 THRESHOLD 이상이면 같은 기사 (제목만 조금 다른 통신사 기사 등)
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+THRESHOLD = 0.7
+MIN_TOKENS = 4  # ✅ 서로 다른 명사가 이보다 적은 기사는 서명이 불안정해서 중복 검사 안 함
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+# ✅ 고정 시드 순열 (저장된 서명과 항상 같은 값이 나오도록)
+_random = np.random.RandomState(1)
+PERM_A = _random.randint(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+PERM_B = _random.randint(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+
+
+def token_hash(token):
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+# ✅ 명사 목록 → MinHash 서명 (uint32 NUM_PERM 개, 명사가 너무 적으면 None)
+def minhash(tokens):
+    tokens = {token for token in tokens if token}
+    if len(tokens) < MIN_TOKENS:
+        return None
+
+    hashes = np.fromiter((token_hash(token) for token in tokens), dtype=np.uint64, count=len(tokens))
+    permuted = ((hashes[:, None] * PERM_A + PERM_B) % MERSENNE_PRIME) & MAX_HASH  # ✅ (명사 수, NUM_PERM)
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+# ✅ 두 서명에서 추정한 자카드 유사도
+def similarity(a, b):
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+class NearDuplicateIndex:
+    """ MinHash 서명 + 구간 버킷 (LSH) 으로 이미 본 기사와 근접 중복인지 찾는 색인
+        - key: 기사 식별자 (링크), scope: 비교 범위 (예: 종목코드, None 이면 전체) """
+
+    def __init__(self, path=None, threshold=THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self.signatures = {}  # ✅ (scope, key) → 서명
+        self.buckets = {}  # ✅ (scope, 구간 번호, 구간 바이트) → [key, ...]
+
+    def __len__(self):
+        return len(self.signatures)
+
+    @staticmethod
+    def band_keys(signature, scope):
+        return [(scope, band, signature[band * ROWS:(band + 1) * ROWS].tobytes()) for band in range(BANDS)]
+
+    # ✅ 같은 버킷 후보 중 추정 유사도가 threshold 이상이고 가장 비슷한 key (없으면 None)
+    def find(self, signature, scope=None):
+        best, best_similarity = None, self.threshold
+        checked = set()
+        for bucket in self.band_keys(signature, scope):
+            for key in self.buckets.get(bucket, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                score = similarity(signature, self.signatures[(scope, key)])
+                if score >= best_similarity:
+                    best, best_similarity = key, score
+        return best
+
+    def add(self, key, signature, scope=None):
+        if (scope, key) in self.signatures:
+            return False
+        self.signatures[(scope, key)] = signature
+        for bucket in self.band_keys(signature, scope):
+            self.buckets.setdefault(bucket, []).append(key)
+        return True
+
+    # ✅ 기사 목록 → (남길 기사, [(중복 기사, 원본 key), ...])
+    #    이미 색인에 있는 기사 + 같은 목록의 앞 기사와 비교, 남긴 기사는 색인에 추가
+    #    같은 key (같은 링크를 다시 처리한 경우) 는 중복으로 보지 않음
+    def dedupe(self, records, tokens, key, scope=None):
+        kept, duplicates = [], []
+        for record in records:
+            signature = minhash(tokens(record))
+            record_key = key(record)
+            record_scope = scope(record) if scope else None
+            if signature is None:
+                kept.append(record)
+                continue
+
+            original = self.find(signature, record_scope)
+            if original is not None and original != record_key:
+                duplicates.append((record, original))
+                continue
+            self.add(record_key, signature, record_scope)
+            kept.append(record)
+        return kept, duplicates
+
+    def load(self):
+        if self.path and os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+            if state["num_perm"] == NUM_PERM and state["bands"] == BANDS:
+                for (scope, key), signature in state["signatures"].items():
+                    self.add(key, signature, scope)
+                print(f"✅ 중복 탐지 색인 로드: {self.path} ({len(self)}개)")
+            else:
+                print(f"⚠️ 중복 탐지 설정 변경 (NUM_PERM/BANDS) → 다시 생성")
+        return self
+
+    # ✅ 임시 파일에 쓴 뒤 교체 (저장 중 중단돼도 이전 색인 유지)
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"num_perm": NUM_PERM, "bands": BANDS, "signatures": self.signatures}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,88 @@
+import time
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# 호스트 하나에 대한 요청 속도 조절 (AIMD)
+# - 응답이 빠르고 정상이면 초당 요청 수를 조금씩 올리고 (additive increase)
+# - 오류가 나거나 응답이 느려지면 절반으로 줄임 (multiplicative decrease)
+class HostThrottle:
+    def __init__(self, concurrency=2, rate=0.5, min_rate=0.1, max_rate=4.0,
+                 increase=0.1, decrease=0.5, slow_latency=3.0):
+        self.semaphore = threading.BoundedSemaphore(concurrency)  # 호스트별 동시 요청 한도
+        self.rate = rate  # 초당 요청 수
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.slow_latency = slow_latency
+        self.next_allowed = 0.0
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    # 다음 요청 가능 시각까지 대기 (현재 속도 기준 간격 유지)
+    def wait_turn(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_allowed)
+            self.next_allowed = start + 1.0 / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+    def record(self, latency, error=False):
+        with self.lock:
+            self.requests += 1
+            if error or latency > self.slow_latency:
+                self.errors += int(error)
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+
+# 도메인별 요청 스케줄러 (호스트마다 동시 요청 한도 + AIMD 속도 조절)
+class PolitenessScheduler:
+    def __init__(self, host_limits=None, default_concurrency=2, **throttle_options):
+        self.host_limits = host_limits or {}  # 예: {"www.hollys.co.kr": 1}
+        self.default_concurrency = default_concurrency
+        self.throttle_options = throttle_options
+        self.throttles = {}
+        self.lock = threading.Lock()
+
+    def throttle(self, url):
+        host = urlsplit(url).netloc or url
+        with self.lock:
+            if host not in self.throttles:
+                concurrency = self.host_limits.get(host, self.default_concurrency)
+                self.throttles[host] = HostThrottle(concurrency=concurrency, **self.throttle_options)
+            return self.throttles[host]
+
+    # 요청 한 건을 감싸서 동시성 한도/간격을 지키고, 걸린 시간과 오류 여부로 속도 조절
+    @contextmanager
+    def slot(self, url):
+        throttle = self.throttle(url)
+        with throttle.semaphore:
+            throttle.wait_turn()
+            start = time.monotonic()
+            try:
+                yield throttle
+            except Exception:
+                throttle.record(time.monotonic() - start, error=True)
+                raise
+            throttle.record(time.monotonic() - start)
+
+    def stats(self):
+        return {host: {"rate": round(t.rate, 3), "requests": t.requests, "errors": t.errors}
+                for host, t in self.throttles.items()}
+
+
+# 문서 로딩 완료 조건 (WebDriverWait 용)
+def document_ready(browser):
+    return browser.execute_script("return document.readyState") == "complete"
+
+
+# 고정 sleep 대신 조건이 만족될 때까지만 대기
+def wait_until(browser, condition, timeout=15):
+    return WebDriverWait(browser, timeout).until(condition)
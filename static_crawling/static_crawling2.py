@@ -7,12 +7,17 @@ from user_agent import generate_user_agent
 from user_agents import parse
 from selenium import webdriver  # 자동화 툴
 from selenium.webdriver.chrome.service import Service
-# from webdriver_manager.chrome
+from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from tqdm import tqdm
 import time  # 시간 지연
 import pandas as pd
 import warnings
+import sys
+
+# 🔥 sys.path 추가하여 crawling 경로의 공용 모듈(metrics) 사용
+sys.path.append("..")
+from metrics import metrics
 
 warnings.filterwarnings('ignore')
 # 서비스 환경별 크롬 드라이브 구분
@@ -39,13 +44,15 @@ def chrom_driver() :
     chrome_options.add_argument('--disable-browser-side-navigation')
     chrome_options.add_argument('--mute-audio')
 
-    # 브라우저 열기
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install())
-                              , options=chrome_options)
+    # 브라우저 열기 (드라이버 설치 + 크롬 실행 시간 기록)
+    with metrics.stage("driver_start"):
+        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install())
+                                  , options=chrome_options)
     # driver = webdriver.Chrome(service=service, options=chrome_options)
     driver.implicitly_wait(3)
     return driver
 
 
 if __name__ == "__main__":
-    chrom_driver()
\ No newline at end of file
+    chrom_driver()
+    metrics.report()
\ No newline at end of file
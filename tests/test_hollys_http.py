@@ -0,0 +1,24 @@
+import os
+import sys
+
+# 🔥 crawling 경로의 공용 모듈(util, politeness, html_parsing, metrics) 사용
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from util.hollys_fixture_server import start_server, load_stores
+from util.hollys_http import crawl_stores_http
+
+COLUMNS = ("지역", "매장명", "현황", "주소", "서비스", "전화번호")
+
+
+# ✅ 저장된 매장 데이터(data/hollys_stores.csv)를 돌려주는 로컬 서버로 HTTP 직접 요청 크롤러 확인
+#    페이지 넘김(다음10개 포함) / 매장 테이블 파싱이 바뀌면 행 수나 값이 CSV 와 달라져서 실패
+def test_crawl_stores_http_matches_saved_stores():
+    stores = load_stores()
+    server, url = start_server(stores=stores)
+    try:
+        rows = crawl_stores_http(url)
+    finally:
+        server.shutdown()
+
+    assert len(rows) == len(stores)
+    for row, store in zip(rows, stores):
+        assert {column: row[column] for column in COLUMNS} == {column: store[column] for column in COLUMNS}
@@ -0,0 +1,105 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from konlpy.tag import Mecab
+
+# ✅ 형태소 분석 결과 캐시 크기 (텍스트 해시 → 명사 목록, 오래 안 쓴 것부터 삭제)
+CACHE_SIZE = 50000
+PROCESS_THRESHOLD = 2000  # ✅ 분석할 텍스트가 이보다 많을 때만 프로세스 풀 사용 (적으면 시작 비용이 더 큼)
+CHUNK_SIZE = 200
+
+
+def text_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+# ✅ 프로세스 풀 작업자: 프로세스마다 Mecab 한 번만 생성 (Mecab 객체는 pickle 불가)
+#    spawn 방식(Windows/macOS)에서는 작업자가 실행 스크립트를 다시 import 하므로 실행 코드는 if __name__ == "__main__": 안에 둘 것
+worker_mecab = None
+
+
+def init_worker():
+    global worker_mecab
+    worker_mecab = Mecab()
+
+
+def worker_nouns(texts):
+    return [worker_mecab.nouns(text) for text in texts]
+
+
+class Tokenizer:
+    """ Mecab 명사 추출 + LRU 캐시 + 배치 처리 (대량 적재 시 프로세스 풀) """
+
+    def __init__(self, cache_size=CACHE_SIZE, processes=None, process_threshold=PROCESS_THRESHOLD):
+        self.mecab = Mecab()
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.processes = processes  # ✅ None/1 이면 현재 프로세스에서만 분석
+        self.process_threshold = process_threshold
+        self.lock = threading.Lock()  # 🔥 yna_async 처럼 여러 스레드에서 호출해도 캐시가 깨지지 않게
+        self.mecab_lock = threading.Lock()  # 🔥 Mecab 인스턴스 하나를 여러 스레드(검색 서버)가 나눠 씀
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        with self.lock:
+            nouns = self.cache.get(key)
+            if nouns is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+            return nouns
+
+    def store(self, key, nouns):
+        with self.lock:
+            self.cache[key] = nouns
+            self.cache.move_to_end(key)
+            self.misses += 1
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    # ✅ 텍스트 하나 → 명사 목록 (같은 텍스트는 다시 분석하지 않음)
+    def nouns(self, text):
+        if not text:
+            return []
+        key = text_hash(text)
+        nouns = self.lookup(key)
+        if nouns is None:
+            with self.mecab_lock:
+                nouns = self.mecab.nouns(text)
+            self.store(key, nouns)
+        return list(nouns)
+
+    # ✅ 텍스트 목록 → 명사 목록의 목록 (중복 제거 + 캐시 조회 후 없는 것만 분석)
+    def nouns_batch(self, texts):
+        keys = [text_hash(text) if text else None for text in texts]
+        results = {}
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key is None or key in results or key in missing:
+                continue
+            nouns = self.lookup(key)
+            if nouns is None:
+                missing[key] = text
+            else:
+                results[key] = nouns
+
+        if missing:
+            for key, nouns in zip(missing, self.analyze(list(missing.values()))):
+                self.store(key, nouns)
+                results[key] = nouns
+
+        return [list(results[key]) if key else [] for key in keys]
+
+    def analyze(self, texts):
+        if not self.processes or self.processes < 2 or len(texts) < self.process_threshold:
+            with self.mecab_lock:
+                return [self.mecab.nouns(text) for text in texts]
+
+        # 🔥 대량 적재: 청크 단위로 여러 프로세스에 나눠 분석 (순서 유지)
+        chunks = [texts[i:i + CHUNK_SIZE] for i in range(0, len(texts), CHUNK_SIZE)]
+        with ProcessPoolExecutor(max_workers=self.processes, initializer=init_worker) as executor:
+            return [nouns for chunk in executor.map(worker_nouns, chunks) for nouns in chunk]
+
+    def stats(self):
+        return {"cached": len(self.cache), "hits": self.hits, "misses": self.misses}
@@ -1,45 +1,40 @@
 import sys
-import time
-import random
 import pandas as pd
-from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 
 # 🔥 sys.path 추가하여 crawling 경로에서 실행 가능하도록 설정
 sys.path.append("..")
 
 # 🔥 올바른 경로에서 driver 가져오기
 from dynamic_crawling import driver
+from politeness import PolitenessScheduler, document_ready, wait_until
+from hollys_http import parse_store_rows, crawl_stores_http
+from metrics import metrics
+
+# ✅ 매장 목록 테이블 (로딩 완료 판단 기준)
+STORE_ROWS = (By.CSS_SELECTOR, "table.tbl_store tbody tr")
+
+# ✅ 호스트별 요청 스케줄러 (고정 대기 대신 응답 속도/오류에 따라 간격 자동 조절)
+scheduler = PolitenessScheduler(host_limits={"www.hollys.co.kr": 1})
 
 def scrape_page_data(browser):
     """ 현재 페이지의 매장 정보를 크롤링하여 리스트 반환 """
-    trs = BeautifulSoup(browser.page_source, 'html.parser').find_all("tr")
-    page_data = []
-
-    for row in trs:
-        cols = row.find_all("td")
-        if len(cols) >= 6:
-            data = {
-                "지역": cols[0].text.strip(),
-                "매장명": cols[1].text.strip(),
-                "현황": cols[2].text.strip(),
-                "주소": cols[3].text.strip(),
-                "서비스": ", ".join(img["alt"] for img in cols[4].find_all("img")),
-                "전화번호": cols[5].text.strip()
-            }
-            page_data.append(data)
-
-    return page_data
-
-if __name__ == "__main__":
-    url = "https://www.hollys.co.kr/store/korea/korStore2.do?a=2&b=3"
-    browser = driver()  # ✅ driver() 함수 호출
-    browser.get(url)
-    time.sleep(random.uniform(2, 4))
+    return parse_store_rows(browser.page_source)
+
+def crawl_stores_selenium(url, total_pages=49):
+    """ 브라우저로 페이지 버튼을 하나씩 눌러 가며 매장 정보 수집 """
+    with metrics.stage("driver_start"):
+        browser = driver()  # ✅ driver() 함수 호출
+    with scheduler.slot(url):
+        with metrics.stage("fetch"):
+            browser.get(url)
+        with metrics.stage("render_wait"):
+            wait_until(browser, document_ready)
+            wait_until(browser, EC.presence_of_element_located(STORE_ROWS))  # ✅ 테이블이 뜰 때까지만 대기
 
     # ✅ 크롤링할 데이터 저장 리스트
     all_data = []
-    total_pages = 49  # 🔥 전체 페이지 수
     page = 1
 
     while page <= total_pages:
@@ -53,15 +48,19 @@ if __name__ == "__main__":
                 break
 
             all_data.extend(page_data)
+            metrics.count("pages")
 
-            time.sleep(random.uniform(2, 4))  # ✅ 대기 시간 추가 (서버 부하 방지)
+            # ✅ 이전 페이지의 첫 행 (새 페이지가 로딩되면 사라짐)
+            old_row = browser.find_element(*STORE_ROWS)
 
             # ✅ 다음 페이지로 이동
             if page % 10 == 0 and page < total_pages:
                 # 🔥 '다음10개' 버튼 클릭
                 try:
                     next_button = browser.find_element(By.XPATH, "//a[contains(@onclick, 'paging')]/img[@alt='다음10개']/parent::a")
-                    next_button.click()
+                    with scheduler.slot(url), metrics.stage("fetch"):
+                        next_button.click()
+                        wait_until(browser, EC.staleness_of(old_row))
                     print(f"➡️ '다음10개' 버튼 클릭하여 새로운 페이지 그룹 로드")
                 except:
                     print("⛔ '다음10개' 버튼이 없습니다. 크롤링 종료.")
@@ -70,27 +69,50 @@ if __name__ == "__main__":
                 # 🔥 개별 페이지 버튼 클릭
                 try:
                     next_page = browser.find_element(By.XPATH, f"//a[contains(@onclick, 'paging({page + 1})')]")
-                    next_page.click()
+                    with scheduler.slot(url), metrics.stage("fetch"):
+                        next_page.click()
+                        wait_until(browser, EC.staleness_of(old_row))
                     print(f"➡️ {page + 1} 페이지로 이동")
                 except:
                     print(f"⛔ {page + 1} 페이지 버튼이 없습니다. 크롤링 종료.")
                     break
 
             page += 1
-            time.sleep(random.uniform(2, 4))  # ✅ 페이지 로딩 대기
+            with metrics.stage("render_wait"):
+                wait_until(browser, EC.presence_of_element_located(STORE_ROWS))  # ✅ 새 테이블이 뜰 때까지만 대기
 
         except Exception as e:
             print(f"⛔ 페이지 이동 실패: {e}")
             break  # 더 이상 페이지가 없으면 종료
 
+    print(f"📊 요청 속도 통계: {scheduler.stats()}")
+
+    browser.quit()  # ✅ 브라우저 닫기 추가
+    print("🚪 브라우저 종료 완료!")
+    return all_data
+
+if __name__ == "__main__":
+    url = "https://www.hollys.co.kr/store/korea/korStore2.do?a=2&b=3"
+    total_pages = 49  # 🔥 전체 페이지 수
+
+    # ✅ HTTP 직접 요청(빠른 경로) 먼저 시도, 실패하면 셀레니움으로 크롤링
+    try:
+        all_data = crawl_stores_http(total_pages=total_pages)
+    except Exception as e:
+        print(f"⚠️ HTTP 직접 요청 실패 → 셀레니움으로 재시도: {e}")
+        print("⚠️ 할리스 페이지 요청 방식(pageNo GET 파라미터)이 바뀌었는지 확인하세요 (util/hollys_http.py)")
+        metrics.count("http_fallbacks")
+        all_data = crawl_stores_selenium(url, total_pages)
+    metrics.count("stores", len(all_data))
+
     # ✅ 크롤링 완료된 데이터 CSV로 저장
-    df = pd.DataFrame(all_data)
-    df.to_csv("hollys_stores.csv", index=False, encoding="utf-8-sig")
+    with metrics.stage("write"):
+        df = pd.DataFrame(all_data)
+        df.to_csv("hollys_stores.csv", index=False, encoding="utf-8-sig")
     print(f"✅ 총 {len(all_data)}개 매장 데이터 저장 완료! (CSV)")
 
     # ✅ 크롤링 데이터를 `.pkl` 파일로 저장
-    df.to_pickle("hollys_stores.pkl")
+    with metrics.stage("write"):
+        df.to_pickle("hollys_stores.pkl")
     print(f"✅ 총 {len(all_data)}개 매장 데이터 저장 완료! (PKL)")
-
-    browser.quit()  # ✅ 브라우저 닫기 추가
-    print("🚪 브라우저 종료 완료!")
+    metrics.report()
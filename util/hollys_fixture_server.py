@@ -0,0 +1,96 @@
+import os
+import csv
+import html
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+# ✅ 저장된 매장 데이터로 할리스 매장 목록 페이지를 흉내 내는 로컬 서버
+#   (실제 사이트에 요청하지 않고 HTTP 직접 요청 / 셀레니움 크롤러를 확인할 때 사용)
+#   사용법: python hollys_fixture_server.py → http://127.0.0.1:8765/store/korea/korStore2.do?pageNo=1
+STORES_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "hollys_stores.csv")
+ROWS_PER_PAGE = 10
+PAGES_PER_GROUP = 10
+
+
+def load_stores(path=STORES_CSV):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def render_page(stores, page):
+    """ 실제 페이지와 같은 table.tbl_store 구조 + paging(n) 버튼 HTML """
+    last_page = max(1, -(-len(stores) // ROWS_PER_PAGE))
+    rows = []
+    for store in stores[(page - 1) * ROWS_PER_PAGE:page * ROWS_PER_PAGE]:
+        services = "".join(f'<img src="/svc.gif" alt="{html.escape(s.strip())}">'
+                           for s in store["서비스"].split(",") if s.strip())
+        rows.append(
+            "<tr>"
+            f"<td>{html.escape(store['지역'])}</td>"
+            f"<td><a href=\"#\">{html.escape(store['매장명'])}</a></td>"
+            f"<td>{html.escape(store['현황'])}</td>"
+            f"<td>{html.escape(store['주소'])}</td>"
+            f"<td>{services}</td>"
+            f"<td>{html.escape(store['전화번호'])}</td>"
+            "</tr>"
+        )
+
+    # 🔥 실제 사이트처럼 현재 10개 묶음의 번호 + '다음10개' 버튼만 노출
+    group_start = (page - 1) // PAGES_PER_GROUP * PAGES_PER_GROUP + 1
+    group_end = min(group_start + PAGES_PER_GROUP - 1, last_page)
+    paging = [f'<a href="#" onclick="paging({n}); return false;">{n}</a>' for n in range(group_start, group_end + 1)]
+    if group_end < last_page:
+        paging.append(f'<a href="#" onclick="paging({group_end + 1}); return false;"><img src="/next.gif" alt="다음10개"></a>')
+
+    return (
+        "<html><head><meta charset=\"utf-8\"></head><body>"
+        "<form name=\"form\" action=\"korStore2.do\"><input type=\"hidden\" name=\"pageNo\" value=\"%d\"></form>"
+        "<table class=\"tbl_store\"><thead><tr><th>지역</th><th>매장명</th><th>현황</th><th>주소</th>"
+        "<th>서비스</th><th>전화번호</th></tr></thead><tbody>%s</tbody></table>"
+        "<div class=\"paging\">%s</div>"
+        "<script>function paging(n){document.form.pageNo.value=n;document.form.submit();}</script>"
+        "</body></html>"
+    ) % (page, "".join(rows), "".join(paging))
+
+
+def make_handler(stores):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if not parts.path.endswith("korStore2.do"):
+                self.send_error(404)
+                return
+            try:
+                page = int(parse_qs(parts.query).get("pageNo", ["1"])[0])
+            except ValueError:
+                page = 1
+
+            body = render_page(stores, page).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+def start_server(host="127.0.0.1", port=0, stores=None):
+    """ 백그라운드 스레드로 서버 시작 → (server, 매장 목록 URL) 반환 (port=0 이면 빈 포트 자동 선택) """
+    server = ThreadingHTTPServer((host, port), make_handler(stores if stores is not None else load_stores()))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://{host}:{server.server_address[1]}/store/korea/korStore2.do"
+    return server, url
+
+
+if __name__ == "__main__":
+    server, url = start_server(port=8765)
+    print(f"✅ 할리스 매장 목록 테스트 서버 실행: {url}?pageNo=1")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
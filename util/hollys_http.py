@@ -0,0 +1,112 @@
+import re
+import sys
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+
+# 🔥 sys.path 추가하여 crawling 경로에서 실행 가능하도록 설정
+sys.path.append("..")
+
+from politeness import PolitenessScheduler
+from html_parsing import parse_html
+from metrics import metrics
+
+# ✅ 할리스 매장 목록 (paging(n) 버튼은 pageNo 파라미터로 같은 페이지를 다시 요청함)
+#    ⚠️ pageNo 이름 / GET 요청은 페이지 버튼 동작을 보고 가정한 것 (실제 응답을 저장해 확인한 적 없음)
+STORE_URL = "https://www.hollys.co.kr/store/korea/korStore2.do"
+STORE_TABLE = ('class="tbl_store"', "</table>")  # ✅ 매장 테이블 구간만 파싱
+MAX_WORKERS = 4  # ✅ 동시에 요청할 페이지 수
+
+
+@metrics.timed("parse")
+def parse_store_rows(html):
+    """ 매장 목록 HTML → 매장 정보 리스트 (scrape_page_data 와 같은 컬럼) """
+    trs = parse_html(html, subtree=STORE_TABLE).select("tr")
+    page_data = []
+
+    for row in trs:
+        cols = row.select("td")
+        if len(cols) >= 6:
+            data = {
+                "지역": cols[0].text().strip(),
+                "매장명": cols[1].text().strip(),
+                "현황": cols[2].text().strip(),
+                "주소": cols[3].text().strip(),
+                "서비스": ", ".join(img.get("alt", "") for img in cols[4].select("img")),
+                "전화번호": cols[5].text().strip()
+            }
+            page_data.append(data)
+
+    return page_data
+
+
+def find_last_page(html):
+    """ 페이지 버튼의 paging(n) 중 가장 큰 번호 (없으면 1) """
+    pages = [int(n) for n in re.findall(r"paging\((\d+)\)", html)]
+    return max(pages, default=1)
+
+
+def make_session(max_workers=MAX_WORKERS):
+    """ 커넥션 풀을 동시 요청 수만큼 잡아 둔 requests 세션 """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=2)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_page(session, page, url=STORE_URL, scheduler=None, timeout=10):
+    """ pageNo 파라미터로 n 페이지 HTML 요청 """
+    def request():
+        with metrics.stage("fetch"):
+            response = session.get(url, params={"pageNo": page}, timeout=timeout)
+        metrics.count("pages")
+        response.raise_for_status()
+        response.encoding = "utf-8"
+        return response.text
+
+    if scheduler is None:
+        return request()
+    with scheduler.slot(url):
+        return request()
+
+
+def crawl_stores_http(url=STORE_URL, total_pages=None, max_workers=MAX_WORKERS):
+    """ 셀레니움 없이 모든 페이지를 동시에 요청해 매장 정보 수집 (실패 시 예외 발생)
+        ⚠️ 페이지 번호를 GET 파라미터 pageNo 로 보낸다고 가정함 (사이트가 다른 이름/POST 를 쓰면 매 페이지가 1 페이지와 같음)
+           → 2 페이지가 1 페이지와 같으면 ValueError 로 알려 셀레니움 경로로 넘어가게 함 """
+    host_limits = {requests.utils.urlparse(url).netloc: max_workers}
+    scheduler = PolitenessScheduler(host_limits=host_limits, rate=2.0, max_rate=8.0)
+
+    with make_session(max_workers) as session:
+        first_page = fetch_page(session, 1, url, scheduler)
+        all_data = parse_store_rows(first_page)
+        if not all_data:
+            raise ValueError("1 페이지에서 매장 정보를 찾지 못했습니다.")
+
+        # ✅ 마지막 페이지 번호는 페이지 버튼(paging(n))에서 확인, 10개 묶음을 넘어가면 다시 확인
+        last_page = total_pages or find_last_page(first_page)
+        next_page = 2
+        print(f"🔄 HTTP 직접 요청 시작 (동시 {max_workers}개)")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while next_page <= last_page:
+                batch = range(next_page, last_page + 1)
+                htmls = executor.map(lambda page: fetch_page(session, page, url, scheduler), batch)
+                for page, html in zip(batch, htmls):
+                    page_data = parse_store_rows(html)
+                    if page == 2 and page_data == all_data[:len(page_data)]:
+                        raise ValueError("2 페이지가 1 페이지와 같습니다. pageNo 파라미터가 무시된 것 같습니다.")
+                    if not page_data:
+                        print(f"⛔ {page} 페이지에 데이터가 없습니다. 이후 페이지 무시.")
+                        last_page = page - 1
+                        break
+                    all_data.extend(page_data)
+                    if not total_pages:
+                        last_page = max(last_page, find_last_page(html))
+                next_page = batch[-1] + 1
+
+        print(f"✅ {last_page} 페이지, {len(all_data)}개 매장 수집")
+
+    print(f"📊 요청 속도 통계: {scheduler.stats()}")
+    return all_data
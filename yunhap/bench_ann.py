@@ -0,0 +1,80 @@
+import sys
+import time
+import numpy as np
+from vector_index import normalize_rows
+from ivf_index import IVFIndex
+
+# ✅ IVF 근사 검색 recall@k 벤치마크 (정확 검색 결과 대비)
+# 사용법: python bench_ann.py [인덱스 파일(.npz)]
+#   - 인덱스 파일을 주면 search_keyword.py 가 저장한 실제 뉴스 벡터로 측정
+#   - 없으면 군집 구조가 있는 합성 벡터로 측정
+
+TOP_K = 10
+N_QUERIES = 200
+NLIST_OPTIONS = [16, 64, 256]
+NPROBE_OPTIONS = [1, 4, 8, 16, 32]
+
+
+# ✅ 합성 벡터 (뉴스 주제처럼 여러 군집으로 모인 분포)
+def make_synthetic_vectors(n=50000, dim=768, n_topics=200, seed=0):
+    rng = np.random.default_rng(seed)
+    topics = rng.normal(size=(n_topics, dim)).astype(np.float32)
+    labels = rng.integers(0, n_topics, size=n)
+    vectors = topics[labels] + 0.6 * rng.normal(size=(n, dim)).astype(np.float32)
+    return normalize_rows(vectors)
+
+
+def load_index_vectors(path):
+    with np.load(path) as data:
+        return np.ascontiguousarray(data["matrix"], dtype=np.float32), data["ids"]
+
+
+# ✅ 정확 검색 top-k (정답 집합)
+def exact_top_k(matrix, queries, top_k):
+    scores = queries @ matrix.T
+    top = np.argpartition(-scores, top_k, axis=1)[:, :top_k]
+    return [set(row) for row in top]
+
+
+def run_benchmark(matrix, ids, top_k=TOP_K, n_queries=N_QUERIES):
+    rng = np.random.default_rng(1)
+    queries = matrix[rng.choice(len(matrix), min(n_queries, len(matrix)), replace=False)]
+    queries = normalize_rows(queries + 0.05 * rng.normal(size=queries.shape).astype(np.float32))
+
+    start = time.perf_counter()
+    truth = exact_top_k(matrix, queries, top_k)
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    row_of = {doc_id: row for row, doc_id in enumerate(ids)}
+
+    print(f"📊 벡터 {len(matrix)}개 × {matrix.shape[1]}차원, 쿼리 {len(queries)}개, recall@{top_k}")
+    print(f"✅ 정확 검색: {exact_ms:.3f} ms/쿼리")
+    print(f"{'nlist':>6} {'nprobe':>6} {'recall':>8} {'ms/쿼리':>9} {'학습(s)':>8}")
+
+    for nlist in NLIST_OPTIONS:
+        if nlist > len(matrix):
+            continue
+        start = time.perf_counter()
+        index = IVFIndex(nlist=nlist).train(matrix)
+        index.add(ids, matrix)
+        train_s = time.perf_counter() - start
+
+        for nprobe in NPROBE_OPTIONS:
+            if nprobe > nlist:
+                continue
+            hits = 0
+            start = time.perf_counter()
+            for query, expected in zip(queries, truth):
+                found, _ = index.search(query, top_k, nprobe=nprobe)
+                hits += len({row_of[str(doc_id)] for doc_id in found} & expected)
+            ms = (time.perf_counter() - start) * 1000 / len(queries)
+            recall = hits / (len(queries) * top_k)
+            print(f"{nlist:>6} {nprobe:>6} {recall:>8.3f} {ms:>9.3f} {train_s:>8.2f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        matrix, ids = load_index_vectors(sys.argv[1])
+    else:
+        matrix = make_synthetic_vectors()
+        ids = np.array([f"{i:024x}" for i in range(len(matrix))], dtype="U24")  # ✅ ObjectId 형식의 가짜 id
+    run_benchmark(matrix, ids)
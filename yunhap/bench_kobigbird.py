@@ -0,0 +1,75 @@
+import sys
+import json
+import time
+import numpy as np
+import torch
+from kobigbird_encoder import KoBigBirdEncoder, MODEL_NAME
+
+# 🔥 sys.path 추가하여 crawling 경로의 공용 모듈(html_parsing) 사용
+sys.path.append("..")
+from html_parsing import parse_html
+
+# ✅ KoBigBird 인코딩 벤치마크 (기존 한 문장씩 인코딩 vs 배치/양자화 인코더)
+# 사용법: python bench_kobigbird.py [문장 수] [스레드 수]
+#   - 처리량(문장/초)과 기존 방식 대비 임베딩 차이(코사인 유사도)를 출력
+N_TEXTS = 256
+SAMPLE_PAGES = ["yna.txt", "../data/asdf.txt"]
+SAMPLE_NEWS = "../finup/data/post_app.json"
+
+
+# ✅ 저장해 둔 연합뉴스 목록/FinUp 응답에서 제목·요약 문장 수집 (부족하면 반복)
+def load_texts(n=N_TEXTS):
+    texts = []
+    for path in SAMPLE_PAGES:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            document = parse_html(f.read())
+        for article in document.select("div.item-box01"):
+            texts += [tag.text(strip=True) for tag in article.select("span.title01, p.lead")]
+    with open(SAMPLE_NEWS, encoding="utf-8") as f:
+        for item in json.load(f)["Result"][0]:
+            texts += [item.get("Title", ""), item.get("Summary", "")]
+
+    texts = [text for text in texts if text]
+    return (texts * (n // len(texts) + 1))[:n]
+
+
+# ✅ 기존 search_keyword2.get_embedding 방식 (한 문장씩, 패딩 포함 평균, no_grad)
+def baseline_encode(tokenizer, model, texts):
+    embeddings = []
+    for text in texts:
+        tokens = tokenizer(text, padding=True, truncation=True, return_tensors="pt", max_length=512)
+        with torch.no_grad():
+            output = model(**tokens)
+        embedding = output.last_hidden_state.mean(dim=1).squeeze().numpy()
+        embeddings.append(embedding / np.linalg.norm(embedding))
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def measure(name, encode, texts, reference=None):
+    encode(texts[:4])  # 워밍업
+    start = time.perf_counter()
+    embeddings = encode(texts)
+    elapsed = time.perf_counter() - start
+    line = f"  {name:<22} {len(texts) / elapsed:8.1f} 문장/초"
+    if reference is not None:
+        cosine = np.sum(embeddings * reference, axis=1)
+        line += f"  (기존 대비 코사인 평균 {cosine.mean():.5f}, 최소 {cosine.min():.5f})"
+    print(line)
+    return embeddings
+
+
+def run_benchmark(n=N_TEXTS, num_threads=None):
+    texts = load_texts(n)
+    print(f"📊 문장 {len(texts)}개, torch 스레드 {num_threads or torch.get_num_threads()}개")
+
+    encoder = KoBigBirdEncoder(MODEL_NAME, num_threads=num_threads)
+    reference = measure("기존 (한 문장씩)", lambda batch: baseline_encode(encoder.tokenizer, encoder.model, batch), texts)
+    measure("배치 + 길이별 패딩", encoder.encode, texts, reference)
+
+    quantized = KoBigBirdEncoder(MODEL_NAME, num_threads=num_threads, quantize=True)
+    measure("배치 + int8 양자화", quantized.encode, texts, reference)
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    run_benchmark(*args)
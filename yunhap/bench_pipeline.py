@@ -0,0 +1,329 @@
+import io
+import os
+import sys
+import json
+import time
+import hashlib
+import tempfile
+import tracemalloc
+import contextlib
+from collections import Counter
+import numpy as np
+import pandas as pd
+import mongomock
+from bson import ObjectId
+from vector_index import NewsVectorIndex, normalize_rows
+from ivf_index import IVFIndex
+from bm25_index import BM25Index
+from vector_shard import VectorShard, DEFAULT_MODEL
+from vector_codec import encode_vector
+from embedding_pipeline import EmbeddingPipeline
+from news_searcher import NewsSearcher
+
+# 🔥 sys.path 추가하여 crawling 경로의 공용 모듈 / finup·util 모듈 사용
+sys.path.append("..")
+sys.path.append("../finup")
+sys.path.append("../util")
+from html_parsing import parse_html
+from bench_parsing import load as load_page, extract_yna, extract_generic, YNA_SECTION
+from text_tokenizer import Tokenizer
+from near_duplicates import NearDuplicateIndex
+from hollys_http import parse_store_rows
+from hollys_fixture_server import load_stores, render_page, ROWS_PER_PAGE
+from stock_master import StockMaster
+from crawl_finup_news import iter_news_items, clean_news_item, load_stock_index
+
+# ✅ 크롤링 → 검색 전체 경로 오프라인 벤치마크 (네트워크/MongoDB/모델 다운로드 없음)
+# 사용법: python bench_pipeline.py [규모 목록] [결과 JSON] [모델 이름]
+#   예) python bench_pipeline.py 10000,100000,1000000 ../data/bench/pipeline.json
+#   - 1) 저장해 둔 페이지/응답(fixture)으로 파싱 → 정리 → 형태소 분석 → 중복 제거 → 임베딩 단계별 시간
+#   - 2) 합성 기사(fixture 명사 + 군집 벡터)를 규모별로 만들어 인덱스별 검색 지연/메모리 측정
+#        MongoDB 는 mongomock 으로 대체 (NewsSearcher 전체 경로는 MONGO_MAX 개까지만)
+#   - 결과 JSON 이 이미 있으면 이전 결과 대비 비율을 함께 출력한 뒤 덮어씀 (성능 변경마다 숫자 남기기)
+#   - 모델 이름을 주면 SentenceTransformer 로 인코딩 (기본은 다운로드 없는 해시 인코더)
+#   - 벡터 차원은 사용하는 모델에서 가져옴 (해시 인코더는 yna.py 모델과 같은 차원)
+SIZES = [10_000, 100_000, 1_000_000]
+RESULT_PATH = "../data/bench/pipeline.json"
+MODEL_DIMS = {DEFAULT_MODEL: 768}  # ✅ yna.py 모델(vector_shard.DEFAULT_MODEL 과 같음)의 차원 - 해시 인코더가 따라 씀
+REPEAT = 20
+N_QUERIES = 50
+TOP_K = 10
+BM25_MAX = 100_000  # ✅ 순수 파이썬 역색인은 1M 에서 수 GB → 이 규모까지만
+MONGO_MAX = 10_000  # ✅ mongomock 은 전체 스캔이라 NewsSearcher 전체 경로는 이 규모까지만
+IVF_NLIST = 256
+CHUNK = 100_000
+
+FIXTURES = {
+    "yna": "yna.txt",
+    "asdf": "../data/asdf.txt",
+    "hollys_page": "../Hollys/text.txt",
+    "finup": "../finup/data/post_app.json",
+    "hollys_csv": "../data/hollys_stores.csv",
+}
+
+
+class HashingEncoder:
+    """ 벤치마크용 인코더 (단어 해시 → 부호 있는 고정 차원 벡터, 모델 로드 없음)
+        SentenceTransformer 와 같은 encode / get_sentence_embedding_dimension 만 제공 """
+
+    def __init__(self, dim=MODEL_DIMS[DEFAULT_MODEL]):
+        self.dim = dim
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, texts, batch_size=32, **kwargs):
+        if isinstance(texts, str):
+            return self.encode([texts])[0]
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in text.split():
+                h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+                vectors[row, h % self.dim] += 1.0 if (h >> 63) else -1.0
+        return normalize_rows(vectors)
+
+
+def load_model(model_name=None):
+    if not model_name:
+        return "bench-hashing", HashingEncoder()
+    from sentence_transformers import SentenceTransformer
+    return model_name, SentenceTransformer(model_name)
+
+
+# ✅ 함수 한 번 실행 시간 (ms, 반복 평균) - 단계별 print 는 숨김
+def measure(func, repeat=1, warmup=True):
+    with contextlib.redirect_stdout(io.StringIO()):
+        if warmup:
+            func()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = func()
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+# ✅ 함수 실행 중 늘어난 메모리 (tracemalloc, numpy 배열 포함) + 실행 시간
+def measure_memory(func):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - start) * 1000
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return elapsed, used / 1024 / 1024, result
+
+
+# ✅ 1) fixture 단계별 시간
+def bench_fixtures(model_name, model, tokenizer, results):
+    print("\n📄 fixture 단계별 시간")
+    pages = {name: load_page(FIXTURES[name]) for name in ("yna", "asdf", "hollys_page")}
+    stores = load_stores(FIXTURES["hollys_csv"])
+    store_pages = [render_page(stores, page) for page in range(1, -(-len(stores) // ROWS_PER_PAGE) + 1)]
+    master = StockMaster.from_json()
+
+    def parse_listings():
+        return [row for name in ("yna", "asdf") for row in extract_yna(parse_html(pages[name], subtree=YNA_SECTION))]
+
+    def clean_finup():
+        stock = load_stock_index(master)["289220"]
+        with open(FIXTURES["finup"], "rb") as f:
+            return [clean_news_item(item, "289220", stock, master.tagger) for item in iter_news_items(f)]
+
+    cases = [
+        ("parse/yna_listing", parse_listings),
+        ("parse/hollys_store_pages", lambda: [row for html in store_pages for row in parse_store_rows(html)]),
+        ("parse/hollys_text_page", lambda: extract_generic(parse_html(pages["hollys_page"]))),
+        ("parse/hollys_csv", lambda: pd.read_csv(FIXTURES["hollys_csv"])),
+        ("clean/finup_stream", clean_finup),
+    ]
+    outputs = {}
+    for name, func in cases:
+        ms, outputs[name] = measure(func, REPEAT)
+        report(results, name, ms=ms, items=len(outputs[name]))
+
+    # ✅ 기사 (제목, 요약) - 연합뉴스 목록 + FinUp 응답
+    articles = [(title or "", summary or "") for title, _, _, summary, _ in outputs["parse/yna_listing"]]
+    articles += [(record["제목"], record["요약"]) for record in outputs["clean/finup_stream"]]
+    texts = [text for article in articles for text in article]
+
+    ms, _ = measure(lambda: master.tagger.tag([{"title": t, "summary": s} for t, s in articles],
+                                              ("title", "summary"), "stocks"), REPEAT)
+    report(results, "clean/stock_tag", ms=ms, items=len(articles))
+
+    cold = Tokenizer(processes=tokenizer.processes)
+    ms, nouns = measure(lambda: cold.nouns_batch(texts), warmup=False)
+    report(results, "mecab/cold", ms=ms, items=len(texts))
+    ms, _ = measure(lambda: cold.nouns_batch(texts), REPEAT)
+    report(results, "mecab/cached", ms=ms, items=len(texts))
+
+    tokens = [nouns[i] + nouns[i + 1] for i in range(0, len(nouns), 2)]
+    ms, (kept, _) = measure(lambda: NearDuplicateIndex().dedupe(
+        list(range(len(tokens))), lambda i: tokens[i], lambda i: i), REPEAT)
+    report(results, "dedup/minhash", ms=ms, items=len(tokens), kept=len(kept))
+
+    keywords = [" ".join(article_tokens) for article_tokens in tokens]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ms, _ = measure(lambda: model.encode(keywords, batch_size=64), REPEAT)
+        report(results, "encode/batch", ms=ms, items=len(keywords))
+        embedder = EmbeddingPipeline(model, model_name, cache_dir=cache_dir)
+        ms, _ = measure(lambda: embedder.encode(keywords), REPEAT)
+        report(results, "encode/cached", ms=ms, items=len(keywords))
+
+    # ✅ 합성 기사용 명사 목록 (자주 나온 순서 → Zipf 분포 순위)
+    vocab = [token for token, _ in Counter(token for article_tokens in tokens for token in article_tokens).most_common()]
+    return vocab, articles
+
+
+# ✅ 합성 기사: fixture 명사를 Zipf 분포로 뽑은 제목/요약 명사 + 주제 군집 벡터 (청크 단위 생성)
+def make_corpus(n, vocab, dim, n_topics=200, seed=0):
+    rng = np.random.default_rng(seed)
+    topics = normalize_rows(rng.standard_normal((n_topics, dim), dtype=np.float32))
+    matrix = np.empty((n, dim), dtype=np.float32)
+    for start in range(0, n, CHUNK):
+        size = min(CHUNK, n - start)
+        labels = rng.integers(0, n_topics, size=size)
+        noise = rng.standard_normal((size, dim), dtype=np.float32) * 0.06
+        matrix[start:start + size] = normalize_rows(topics[labels] + noise)
+
+    ids = np.asarray([f"{i:024x}" for i in range(1, n + 1)], dtype="U24")  # ✅ _id 오름차순 (ObjectId 형식)
+    weights = 1.0 / np.arange(1, len(vocab) + 1) ** 1.1
+    terms = rng.choice(len(vocab), size=(min(n, BM25_MAX), 26), p=weights / weights.sum())
+    return matrix, ids, terms
+
+
+def make_queries(matrix, terms, vocab, n_queries=N_QUERIES, seed=1):
+    rng = np.random.default_rng(seed)
+    rows = rng.choice(len(matrix), n_queries, replace=False)
+    vectors = normalize_rows(matrix[rows] + 0.02 * rng.standard_normal(matrix[rows].shape, dtype=np.float32))
+    words = [[vocab[t] for t in terms[row % len(terms)][:3]] for row in rows]
+    return vectors, words
+
+
+# ✅ 2) 규모별 검색 지연/메모리
+def bench_search(n, vocab, articles, model_name, model, tokenizer, results, work_dir):
+    dim = model.get_sentence_embedding_dimension()
+    print(f"\n📊 합성 기사 {n:,}개 × {dim}차원")
+    matrix, ids, terms = make_corpus(n, vocab, dim)
+    query_vectors, query_terms = make_queries(matrix, terms, vocab)
+
+    def build_exact():
+        index = NewsVectorIndex(None, model_name, dim=dim, index_dir=work_dir)
+        index.matrix, index.ids = matrix, ids
+        return index
+
+    def search_all(search):
+        return lambda: [search(i) for i in range(len(query_vectors))]
+
+    exact = build_exact()
+    ms, _ = measure(search_all(lambda i: exact.search(query_vectors[i], TOP_K)), 3)
+    report(results, f"search_{n}/exact", ms=ms / N_QUERIES, mb=(matrix.nbytes + ids.nbytes) / 1024 / 1024)
+
+    def build_ivf():
+        index = IVFIndex(nlist=min(IVF_NLIST, n // 39)).train(matrix)
+        index.add(ids, matrix)
+        return index
+    build_ms, mb, ivf = measure_memory(build_ivf)
+    ms, _ = measure(search_all(lambda i: ivf.search(query_vectors[i], TOP_K, nprobe=8)), 3)
+    report(results, f"search_{n}/ivf", ms=ms / N_QUERIES, mb=mb, build_ms=build_ms)
+
+    # ✅ 벡터 샤드: 파일로 내보낸 뒤 memmap 검색 (프로세스 메모리 대신 페이지 캐시 사용)
+    shard = VectorShard(os.path.join(work_dir, f"shard_{n}"), model_name)
+    start = time.perf_counter()
+    for chunk in range(0, n, CHUNK):
+        shard.append(ids[chunk:chunk + CHUNK], matrix[chunk:chunk + CHUNK],
+                     [{"title": vocab[i % len(vocab)]} for i in range(chunk, min(n, chunk + CHUNK))])
+    build_ms = (time.perf_counter() - start) * 1000
+    shard.open()
+    ms, _ = measure(search_all(lambda i: shard.search(query_vectors[i], TOP_K)), 3)
+    disk_mb = os.path.getsize(shard.file("vectors.f32")) / 1024 / 1024
+    report(results, f"search_{n}/shard", ms=ms / N_QUERIES, disk_mb=disk_mb, build_ms=build_ms)
+
+    if n <= BM25_MAX:
+        def build_bm25():
+            index = BM25Index(path=os.path.join(work_dir, f"bm25_{n}.pkl"))
+            for doc_id, row in zip(ids, terms):
+                index.add(doc_id, [vocab[t] for t in row[:6]], [vocab[t] for t in row[6:]])
+            return index
+        build_ms, mb, bm25 = measure_memory(build_bm25)
+        ms, _ = measure(lambda: [bm25.search(words, TOP_K) for words in query_terms], 3)
+        report(results, f"search_{n}/bm25", ms=ms / N_QUERIES, mb=mb, build_ms=build_ms)
+
+    if n <= MONGO_MAX:
+        bench_searcher(n, matrix, ids, terms, vocab, articles, model_name, model, tokenizer, results, work_dir)
+
+
+# ✅ NewsSearcher 전체 경로 (mongomock 컬렉션 → 인덱스 로드 → 하이브리드 검색 → 문서 조회)
+def bench_searcher(n, matrix, ids, terms, vocab, articles, model_name, model, tokenizer, results, work_dir):
+    collection = mongomock.MongoClient().db.latest_news
+    docs = []
+    for row, (doc_id, vector) in enumerate(zip(ids, matrix)):
+        title_nouns = [vocab[t] for t in terms[row][:6]]
+        summary_nouns = [vocab[t] for t in terms[row][6:]]
+        docs.append({"_id": ObjectId(doc_id), "title": " ".join(title_nouns),
+                     "summary": " ".join(summary_nouns), "link": f"https://bench/{row}", "date": "2025-01-01",
+                     "title_nouns": title_nouns, "summary_nouns": summary_nouns,
+                     "vector": encode_vector(vector, model_name)})
+    collection.insert_many(docs)
+
+    def encode_query(query):
+        return np.asarray(model.encode(" ".join(tokenizer.nouns(query)) or query), dtype=np.float32)
+
+    index_dir = os.path.join(work_dir, f"searcher_{n}")
+    build_ms, mb, searcher = measure_memory(lambda: NewsSearcher(
+        collection, model_name, encode_query, tokenizer, dim=matrix.shape[1], refresh_interval=3600,
+        index_dir=index_dir))
+    searcher.last_refresh = time.monotonic()
+    queries = [title for title, _ in articles if title][:N_QUERIES]
+    for mode in ("exact", "ivf"):
+        ms, _ = measure(lambda: [searcher.search(query, 5, mode=mode) for query in queries], 1)
+        report(results, f"searcher_{n}/{mode}", ms=ms / len(queries),
+               **({"mb": mb, "build_ms": build_ms} if mode == "exact" else {}))
+
+
+def report(results, name, **values):
+    results[name] = {key: round(float(value), 4) for key, value in values.items()}
+    line = f"  {name:<26}"
+    if "ms" in values:
+        line += f" {values['ms']:10.3f} ms"
+    for key in ("mb", "disk_mb", "build_ms", "items", "kept"):
+        if key in values:
+            line += f"  {key}={values[key]:,.1f}" if isinstance(values[key], float) else f"  {key}={values[key]:,}"
+    previous = PREVIOUS.get(name, {}).get("ms")
+    if previous and values.get("ms"):
+        line += f"  (이전 대비 x{previous / values['ms']:.2f})"
+    print(line)
+
+
+PREVIOUS = {}
+
+
+def run_benchmark(sizes=SIZES, result_path=RESULT_PATH, model_name=None):
+    model_name, model = load_model(model_name)
+    dim = model.get_sentence_embedding_dimension()
+    if os.path.exists(result_path):
+        with open(result_path, encoding="utf-8") as f:
+            previous = json.load(f)
+        if previous.get("dim") == dim:
+            PREVIOUS.update(previous["results"])
+        else:
+            print(f"⚠️ 이전 결과는 {previous.get('dim')}차원 → 비교 생략 (현재 {dim}차원)")
+
+    tokenizer = Tokenizer()
+    results = {}
+    vocab, articles = bench_fixtures(model_name, model, tokenizer, results)
+    with tempfile.TemporaryDirectory() as work_dir:
+        for n in sizes:
+            bench_search(n, vocab, articles, model_name, model, tokenizer, results, work_dir)
+
+    os.makedirs(os.path.dirname(result_path) or ".", exist_ok=True)
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump({"model": model_name, "dim": dim, "sizes": sizes, "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+                   "results": results}, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {result_path}")
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1].split(",")] if len(sys.argv) > 1 else SIZES
+    run_benchmark(sizes, *sys.argv[2:4])
@@ -0,0 +1,40 @@
+import sys
+import json
+import time
+import numpy as np
+from urllib.parse import quote
+from urllib.request import urlopen
+from concurrent.futures import ThreadPoolExecutor
+
+# ✅ 검색 서버 동시 요청 지연 시간(p50/p95/p99) 측정
+# 사용법: python search_server.py 실행 후 python bench_search_server.py [검색 URL] [모델]
+URL = "http://127.0.0.1:8767/search"
+CONCURRENCY_OPTIONS = [1, 8, 32]
+REQUESTS = 400
+QUERIES = ["전세사고", "아파트 매매", "부동산 대출 규제", "청약 경쟁률", "재건축", "전세 사기 피해", "공시가격", "금리 인하"]
+
+
+def fetch(url, model, query):
+    start = time.perf_counter()
+    with urlopen(f"{url}?q={quote(query)}&model={model}") as response:
+        json.load(response)
+    return (time.perf_counter() - start) * 1000
+
+
+def run_benchmark(url=URL, model="sbert", requests=REQUESTS):
+    for concurrency in CONCURRENCY_OPTIONS:
+        queries = [QUERIES[i % len(QUERIES)] + ("" if i < len(QUERIES) else f" {i}") for i in range(requests)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies = np.array(list(executor.map(lambda query: fetch(url, model, query), queries)))
+        elapsed = time.perf_counter() - start
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        print(f"  동시 {concurrency:>3}  p50 {p50:7.2f} ms  p95 {p95:7.2f} ms  p99 {p99:7.2f} ms  "
+              f"({requests / elapsed:6.1f} 요청/초)")
+
+    with urlopen(url.rsplit("/", 1)[0] + "/health") as response:
+        print(f"📊 배치 통계: {json.load(response)['models'].get(model)}")
+
+
+if __name__ == "__main__":
+    run_benchmark(*sys.argv[1:3])
@@ -0,0 +1,148 @@
+import os
+import math
+import pickle
+import threading
+from collections import Counter
+from bson import ObjectId
+from vector_index import INDEX_DIR
+
+# ✅ 제목/요약 명사(title_nouns, summary_nouns) 역색인 파일
+BM25_PATH = os.path.join(INDEX_DIR, "bm25.pkl")
+FIELDS = ("title", "summary")
+FIELD_WEIGHTS = {"title": 2.0, "summary": 1.0}  # ✅ 제목에 나온 단어에 가중치
+K1 = 1.2
+B = 0.75
+
+
+class BM25Index:
+    """ 기사 제목/요약 명사 역색인 (단어 → {문서 번호: 필드별 빈도}) + BM25F 점수 """
+
+    def __init__(self, collection=None, tokenizer=None, field_weights=FIELD_WEIGHTS, k1=K1, b=B, path=BM25_PATH):
+        self.collection = collection
+        self.tokenizer = tokenizer  # ✅ 명사가 저장되지 않은 옛 기사만 분석할 때 사용
+        self.field_weights = field_weights
+        self.k1 = k1
+        self.b = b
+        self.path = path
+
+        self.postings = {}  # ✅ 단어 → {문서 번호: (제목 빈도, 요약 빈도)}
+        self.doc_ids = []  # ✅ 문서 번호 → ObjectId 문자열
+        self.doc_numbers = {}  # ✅ ObjectId 문자열 → 문서 번호
+        self.field_lengths = {field: [] for field in FIELDS}
+        self.total_lengths = {field: 0 for field in FIELDS}
+        self.last_id = None
+        self.lock = threading.RLock()  # 🔥 검색 서버에서 여러 검색기(모델)가 같은 역색인을 공유할 때 갱신/검색 순서 보장
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    # ✅ 기사 하나 추가 (이미 있는 _id 는 무시) → 추가됐으면 True
+    def add(self, doc_id, title_nouns, summary_nouns):
+        doc_id = str(doc_id)
+        if doc_id in self.doc_numbers:
+            return False
+
+        doc_no = len(self.doc_ids)
+        self.doc_ids.append(doc_id)
+        self.doc_numbers[doc_id] = doc_no
+
+        counts = [Counter(title_nouns or []), Counter(summary_nouns or [])]
+        for field, tokens in zip(FIELDS, (title_nouns or [], summary_nouns or [])):
+            self.field_lengths[field].append(len(tokens))
+            self.total_lengths[field] += len(tokens)
+        for term in counts[0].keys() | counts[1].keys():
+            self.postings.setdefault(term, {})[doc_no] = (counts[0][term], counts[1][term])
+        return True
+
+    # ✅ MongoDB 문서 목록 추가 (명사가 없으면 tokenizer 로 배치 분석)
+    def add_documents(self, docs):
+        docs = [doc for doc in docs if "_id" in doc]
+        missing = [doc for doc in docs if "title_nouns" not in doc or "summary_nouns" not in doc]
+        if missing and self.tokenizer is not None:
+            title_nouns = self.tokenizer.nouns_batch([doc.get("title") for doc in missing])
+            summary_nouns = self.tokenizer.nouns_batch([doc.get("summary") for doc in missing])
+            for doc, title_tokens, summary_tokens in zip(missing, title_nouns, summary_nouns):
+                doc["title_nouns"], doc["summary_nouns"] = title_tokens, summary_tokens
+
+        added = 0
+        for doc in docs:
+            added += self.add(doc["_id"], doc.get("title_nouns"), doc.get("summary_nouns"))
+            if isinstance(doc["_id"], ObjectId) and (self.last_id is None or doc["_id"] > self.last_id):
+                self.last_id = doc["_id"]
+        return added
+
+    # ✅ 디스크 캐시 로드 후 새로 저장된 기사만 추가
+    def load(self):
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+            self.__dict__.update({key: state[key] for key in
+                                  ("postings", "doc_ids", "field_lengths", "total_lengths", "last_id")})
+            self.doc_numbers = {doc_id: doc_no for doc_no, doc_id in enumerate(self.doc_ids)}
+            print(f"✅ BM25 인덱스 로드: {self.path} ({len(self)}개)")
+        if self.collection is not None:
+            self.refresh()
+        return self
+
+    # ✅ 마지막 _id 이후에 저장된 기사만 색인
+    def refresh(self):
+        query = {"_id": {"$gt": self.last_id}} if self.last_id is not None else {}
+        fields = {"title": 1, "summary": 1, "title_nouns": 1, "summary_nouns": 1}
+        added = self.add_documents(list(self.collection.find(query, fields).sort("_id", 1)))
+        if added:
+            self.save()
+            print(f"✅ BM25 인덱스 갱신: {added}개 추가 (총 {len(self)}개)")
+        return added
+
+    # ✅ 기사를 지우거나 명사를 다시 만든 경우 전체 재구성
+    def rebuild(self):
+        self.__init__(self.collection, self.tokenizer, self.field_weights, self.k1, self.b, self.path)
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.refresh()
+        return self
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        state = {key: getattr(self, key) for key in
+                 ("postings", "doc_ids", "field_lengths", "total_lengths", "last_id")}
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+    # ✅ BM25F: 필드별 길이 정규화한 빈도를 가중합 → 단어별 idf 와 곱해 합산
+    def term_scores(self, query_terms, doc_numbers=None):
+        n = len(self.doc_ids)
+        scores = {}
+        if not n:
+            return scores
+
+        avg_lengths = [self.total_lengths[field] / n or 1.0 for field in FIELDS]
+        weights = [self.field_weights.get(field, 1.0) for field in FIELDS]
+        for term in set(query_terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            targets = postings if doc_numbers is None else [d for d in doc_numbers if d in postings]
+            for doc_no in targets:
+                weighted_tf = 0.0
+                for i, tf in enumerate(postings[doc_no]):
+                    if tf:
+                        length = self.field_lengths[FIELDS[i]][doc_no]
+                        weighted_tf += weights[i] * tf / (1 - self.b + self.b * length / avg_lengths[i])
+                scores[doc_no] = scores.get(doc_no, 0.0) + idf * weighted_tf / (self.k1 + weighted_tf)
+        return scores
+
+    # ✅ 검색어 명사 → BM25 상위 top_k 기사 (ObjectId 목록, 점수 목록)
+    def search(self, query_terms, top_k=50):
+        scores = self.term_scores(query_terms)
+        top = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+        return [ObjectId(self.doc_ids[doc_no]) for doc_no, _ in top], [score for _, score in top]
+
+    # ✅ 주어진 후보 기사만 점수 계산 (색인에 없는 기사는 0점)
+    def score(self, query_terms, doc_ids):
+        doc_numbers = [self.doc_numbers.get(str(doc_id)) for doc_id in doc_ids]
+        scores = self.term_scores(query_terms, [d for d in doc_numbers if d is not None])
+        return [scores.get(doc_no, 0.0) if doc_no is not None else 0.0 for doc_no in doc_numbers]
@@ -0,0 +1,111 @@
+import os
+import pickle
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from vector_index import model_file_name
+
+# ✅ 임베딩 캐시 저장 폴더 (모델별 파일 1개, 새로 인코딩한 벡터만 뒤에 이어 씀)
+CACHE_DIR = "../data/embedding_cache"
+CACHE_SIZE = 200_000  # ✅ 메모리에 유지할 최대 벡터 수 (오래 안 쓴 것부터 제거, 파일은 2배가 넘으면 다시 씀)
+
+
+# ✅ 텍스트 내용 해시 (같은 키워드 문자열 → 같은 캐시 키)
+def text_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingPipeline:
+    """ 텍스트를 모아 배치로 인코딩하고, 같은 문자열은 디스크 캐시(모델별)에서 재사용하는 임베딩 단계
+        - 캐시 파일: save() 마다 새 벡터 {hash: vector} 를 pickle 한 덩어리씩 뒤에 추가 (전체를 다시 쓰지 않음)
+        - 메모리: 최근에 쓴 cache_size 개만 유지 (LRU) """
+
+    def __init__(self, model, model_name, batch_size=64, cache_dir=CACHE_DIR, cache_size=CACHE_SIZE):
+        self.model = model
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.cache_path = os.path.join(cache_dir, f"{model_file_name(model_name)}.pkl")
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.pending = []  # ✅ add() 로 모아 둔 (key, text)
+        self.new_entries = {}  # ✅ 아직 파일에 쓰지 않은 벡터
+        self.logged = 0  # ✅ 캐시 파일에 쓰인 벡터 수 (중복/제거된 것 포함)
+
+        if os.path.exists(self.cache_path):
+            self.load()
+            print(f"✅ 임베딩 캐시 로드: {self.cache_path} ({len(self.cache)}개)")
+
+    # ✅ 캐시 파일의 덩어리를 순서대로 읽기 (나중 것이 최근) - 쓰다 끊긴 마지막 덩어리는 잘라냄
+    def load(self):
+        with open(self.cache_path, "r+b") as f:
+            while True:
+                offset = f.tell()
+                try:
+                    entries = pickle.load(f)
+                except EOFError:
+                    break
+                except (pickle.UnpicklingError, ValueError, TypeError):
+                    print(f"⚠️ 임베딩 캐시 파일 끝이 손상됨 → {offset} 바이트 이후 삭제")
+                    f.truncate(offset)
+                    break
+                self.logged += len(entries)
+                for h, vector in entries.items():
+                    self.cache[h] = vector
+                    self.cache.move_to_end(h)
+        self.evict()
+
+    def evict(self):
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    # ✅ 텍스트 목록 → 벡터 목록 (중복 제거 + 캐시 조회 후 없는 것만 배치 인코딩)
+    def encode(self, texts):
+        hashes = [text_hash(text) for text in texts]
+        missing = {}
+        for h, text in zip(hashes, texts):
+            if h in self.cache:
+                self.cache.move_to_end(h)
+            elif h not in missing:
+                missing[h] = text
+
+        if missing:
+            vectors = self.model.encode(list(missing.values()), batch_size=self.batch_size)
+            for h, vector in zip(missing, vectors):
+                self.cache[h] = self.new_entries[h] = np.asarray(vector, dtype=np.float32)
+
+        print(f"✅ 임베딩: {len(texts)}개 요청 → {len(missing)}개 인코딩 (캐시 재사용 {len(texts) - len(missing)}개)")
+        result = [self.cache[h] for h in hashes]
+        self.evict()  # 🔥 결과를 꺼낸 뒤에 제거 (이번 요청 벡터가 cache_size 보다 많아도 안전)
+        return result
+
+    # ✅ 인코딩할 텍스트를 버퍼에 추가 (flush 때 한 번에 처리)
+    def add(self, key, text):
+        self.pending.append((key, text))
+
+    # ✅ 버퍼에 모인 텍스트를 배치 인코딩해 {key: vector} 반환
+    def flush(self):
+        if not self.pending:
+            return {}
+        keys, texts = zip(*self.pending)
+        self.pending = []
+        return dict(zip(keys, self.encode(list(texts))))
+
+    # ✅ 새로 인코딩한 벡터만 캐시 파일 뒤에 추가
+    #    🔥 파일에 쌓인 벡터가 cache_size 의 2배를 넘으면 메모리에 남은 것만 새 파일로 다시 씀 (파일 크기 제한)
+    def save(self):
+        if not self.new_entries:
+            return
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        if self.logged + len(self.new_entries) > 2 * self.cache_size:
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(dict(self.cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+            self.logged = len(self.cache)
+            print(f"💾 임베딩 캐시 다시 쓰기: {self.cache_path} ({len(self.cache)}개)")
+        else:
+            with open(self.cache_path, "ab") as f:
+                pickle.dump(self.new_entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self.logged += len(self.new_entries)
+            print(f"💾 임베딩 캐시 추가: {self.cache_path} (+{len(self.new_entries)}개)")
+        self.new_entries = {}
@@ -0,0 +1,52 @@
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+
+class IdAllocator:
+    """ counters 컬렉션의 $inc 로 id 블록을 원자적으로 예약하고, 프로세스 안에서 하나씩 나눠주는 할당기
+
+    여러 크롤러 프로세스가 동시에 실행돼도 각자 겹치지 않는 블록을 받으므로 id 가 중복되지 않음
+    """
+
+    def __init__(self, db, name, block_size=100, seed_collection=None, seed_field="id"):
+        self.counters = db["counters"]
+        self.name = name
+        self.block_size = block_size
+        self.seed_collection = seed_collection
+        self.seed_field = seed_field
+        self.next_value = 0
+        self.block_end = -1  # ✅ 현재 블록의 마지막 id (이 값까지 로컬에서 발급)
+        self.seeded = False
+
+    # ✅ 카운터가 기존 문서의 최대 id 보다 작지 않도록 맞춤 ($max 라서 여러 번/동시에 실행해도 안전)
+    def _seed(self):
+        if self.seed_collection is not None:
+            last_doc = self.seed_collection.find_one({self.seed_field: {"$exists": True}}, {self.seed_field: 1},
+                                                     sort=[(self.seed_field, -1)])
+            max_id = last_doc[self.seed_field] if last_doc else 0
+            self._upsert({"$max": {"seq": max_id}})
+        self.seeded = True
+
+    def _upsert(self, update):
+        try:
+            return self.counters.find_one_and_update({"_id": self.name}, update, upsert=True,
+                                                     return_document=ReturnDocument.AFTER)
+        except DuplicateKeyError:
+            # 🔥 다른 프로세스가 같은 카운터 문서를 동시에 만든 경우 → 이제 문서가 있으므로 다시 시도
+            return self.counters.find_one_and_update({"_id": self.name}, update,
+                                                     return_document=ReturnDocument.AFTER)
+
+    # ✅ 새 블록 예약 (DB 왕복 1회)
+    def _reserve_block(self):
+        if not self.seeded:
+            self._seed()
+        doc = self._upsert({"$inc": {"seq": self.block_size}})
+        self.block_end = doc["seq"]
+        self.next_value = self.block_end - self.block_size + 1
+
+    def next_id(self):
+        if self.next_value > self.block_end:
+            self._reserve_block()
+        value = self.next_value
+        self.next_value += 1
+        return value
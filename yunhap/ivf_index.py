@@ -0,0 +1,181 @@
+import os
+import numpy as np
+from bson import ObjectId
+from vector_index import INDEX_DIR, model_file_name, normalize_rows
+
+RETRAIN_GROWTH = 2.0  # ✅ 학습 때보다 벡터 수가 이 배수 이상 늘면 중심점 다시 학습 (작을 때 만든 적은 nlist 로 계속 쓰지 않도록)
+
+
+# ✅ IVF 인덱스 파일 경로 (정확 검색 인덱스 옆에 저장)
+def ivf_path(model_name, index_dir=INDEX_DIR):
+    return os.path.join(index_dir, f"{model_file_name(model_name)}.ivf.npz")
+
+
+class IVFIndex:
+    """ k-means 중심점으로 벡터를 나눠 두고, 가까운 nprobe 개 리스트만 비교하는 근사 검색 인덱스
+
+    - nlist  : 중심점(리스트) 개수. 클수록 리스트가 작아져 빠르지만 학습이 오래 걸림
+    - nprobe : 검색 시 살펴볼 리스트 개수. 클수록 recall ↑, 속도 ↓
+    """
+
+    def __init__(self, nlist=64, nprobe=8, seed=0):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.seed = seed
+        self.centroids = None  # ✅ (nlist, dim) 정규화된 중심점
+        self.list_vectors = []  # ✅ 리스트별 (n_i, dim) 벡터
+        self.list_ids = []  # ✅ 리스트별 ObjectId 문자열
+        self.known_ids = set()
+        self.trained_size = 0  # ✅ 학습에 쓴 벡터 수 (다시 학습할지 판단)
+
+    def __len__(self):
+        return len(self.known_ids)
+
+    @property
+    def is_trained(self):
+        return self.centroids is not None
+
+    # ✅ 구면 k-means 학습 (코사인 유사도 기준, 큰 컬렉션은 샘플만 사용)
+    def train(self, matrix, n_iter=20, max_train_per_list=256):
+        rng = np.random.default_rng(self.seed)
+        matrix = normalize_rows(np.asarray(matrix, dtype=np.float32))
+        nlist = min(self.nlist, len(matrix))
+        if nlist == 0:
+            raise ValueError("학습할 벡터가 없습니다.")
+
+        sample_size = min(len(matrix), nlist * max_train_per_list)
+        sample = matrix[rng.choice(len(matrix), sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+        for _ in range(n_iter):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assign, kind="stable")
+            clusters, starts = np.unique(assign[order], return_index=True)
+            sums = np.add.reduceat(sample[order], starts, axis=0)
+
+            new_centroids = sample[rng.choice(sample_size, nlist)].copy()  # 🔥 빈 클러스터는 임의 점으로 재초기화
+            new_centroids[clusters] = sums
+            centroids = normalize_rows(new_centroids)
+
+        self.nlist = nlist
+        self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+        self.list_vectors = [np.empty((0, matrix.shape[1]), dtype=np.float32) for _ in range(nlist)]
+        self.list_ids = [np.empty(0, dtype="U24") for _ in range(nlist)]
+        self.known_ids = set()
+        self.trained_size = len(matrix)
+        return self
+
+    # ✅ 학습 이후 벡터가 RETRAIN_GROWTH 배 이상 늘었는지 (이전 형식 파일은 학습 크기를 몰라 한 번 다시 학습)
+    def needs_retrain(self, growth=RETRAIN_GROWTH):
+        return len(self) >= growth * max(self.trained_size, 1)
+
+    # ✅ 새 벡터를 가장 가까운 리스트에 추가 (이미 있는 id 는 무시)
+    def add(self, ids, vectors):
+        if not self.is_trained:
+            raise ValueError("IVF 인덱스가 학습되지 않았습니다. train() 먼저 호출하세요.")
+
+        ids = np.asarray([str(i) for i in ids], dtype="U24")
+        keep = np.array([i not in self.known_ids for i in ids], dtype=bool)
+        if not keep.any():
+            return 0
+
+        ids = ids[keep]
+        vectors = normalize_rows(np.asarray(vectors, dtype=np.float32)[keep])
+        assign = np.argmax(vectors @ self.centroids.T, axis=1)
+
+        for list_no in np.unique(assign):
+            rows = assign == list_no
+            self.list_vectors[list_no] = np.vstack([self.list_vectors[list_no], vectors[rows]])
+            self.list_ids[list_no] = np.concatenate([self.list_ids[list_no], ids[rows]])
+        self.known_ids.update(ids.tolist())
+        return len(ids)
+
+    # ✅ 가까운 nprobe 개 리스트 안에서만 코사인 유사도 top_k 계산
+    def search(self, query_vector, top_k=5, nprobe=None):
+        if not self.is_trained or not len(self):
+            return [], np.empty(0, dtype=np.float32)
+
+        query = np.asarray(query_vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+        centroid_scores = self.centroids @ query
+        probes = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        probes = [p for p in probes if len(self.list_ids[p])]
+        if not probes:
+            return [], np.empty(0, dtype=np.float32)
+
+        candidates = np.vstack([self.list_vectors[p] for p in probes])
+        candidate_ids = np.concatenate([self.list_ids[p] for p in probes])
+        scores = candidates @ query
+
+        if top_k < len(scores):
+            top = np.argpartition(-scores, top_k)[:top_k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top])]
+        return [ObjectId(i) for i in candidate_ids[top]], scores[top]
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sizes = np.array([len(ids) for ids in self.list_ids], dtype=np.int64)
+        np.savez(
+            path,
+            centroids=self.centroids,
+            sizes=sizes,
+            vectors=np.vstack(self.list_vectors),
+            ids=np.concatenate(self.list_ids),
+            params=np.array([self.nlist, self.nprobe, self.seed, self.trained_size], dtype=np.int64),
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            nlist, nprobe, seed, *trained_size = (int(v) for v in data["params"])
+            index = cls(nlist=nlist, nprobe=nprobe, seed=seed)
+            index.trained_size = trained_size[0] if trained_size else 0
+            index.centroids = np.ascontiguousarray(data["centroids"], dtype=np.float32)
+            offsets = np.concatenate([[0], np.cumsum(data["sizes"])])
+            vectors, ids = data["vectors"], data["ids"]
+
+        index.list_vectors = [np.ascontiguousarray(vectors[s:e]) for s, e in zip(offsets[:-1], offsets[1:])]
+        index.list_ids = [ids[s:e] for s, e in zip(offsets[:-1], offsets[1:])]
+        index.known_ids = set(ids.tolist())
+        return index
+
+    # ✅ 저장된 IVF 파일이 있으면 로드, 없으면 정확 검색 인덱스(NewsVectorIndex)로 학습 후 저장
+    #    학습 이후 벡터가 RETRAIN_GROWTH 배 이상 늘었으면 전체 벡터로 다시 학습
+    @classmethod
+    def load_or_build(cls, vector_index, nlist=64, nprobe=8, index_dir=INDEX_DIR):
+        path = ivf_path(vector_index.model_name, index_dir)
+        if os.path.exists(path):
+            index = cls.load(path)
+            if index.centroids.shape[1] != vector_index.dim:
+                print("⚠️ IVF 인덱스 차원 불일치 → 다시 학습")
+            else:
+                index.nprobe = nprobe
+                added = index.sync(vector_index)
+                if not index.needs_retrain():
+                    if added:
+                        index.save(path)
+                    print(f"✅ IVF 인덱스 로드: {path} ({len(index)}개, nlist={index.nlist})")
+                    return index
+                print(f"⚠️ IVF 인덱스 학습 후 벡터 증가 ({index.trained_size}개 → {len(index)}개) → 다시 학습")
+
+        index = cls(nlist=nlist, nprobe=nprobe).train(vector_index.matrix)
+        index.add(vector_index.ids, vector_index.matrix)
+        index.save(path)
+        print(f"✅ IVF 인덱스 생성: {path} ({len(index)}개, nlist={index.nlist})")
+        return index
+
+    # ✅ 정확 검색 인덱스에는 있지만 IVF 에는 아직 없는 벡터만 추가
+    def sync(self, vector_index, path=None):
+        missing = np.array([i not in self.known_ids for i in vector_index.ids], dtype=bool)
+        if not missing.any():
+            return 0
+        added = self.add(vector_index.ids[missing], vector_index.matrix[missing])
+        if path:
+            self.save(path)
+        return added
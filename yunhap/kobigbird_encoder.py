@@ -0,0 +1,56 @@
+import numpy as np
+import torch
+from transformers import AutoModel, AutoTokenizer
+
+# ✅ CPU 전용 KoBigBird 인코더 설정
+MODEL_NAME = "monologg/kobigbird-bert-base"
+MAX_LENGTH = 512
+BATCH_SIZE = 16  # ✅ 한 번에 forward 할 문장 수 (길이가 비슷한 문장끼리 묶음)
+
+
+class KoBigBirdEncoder:
+    """ 배치 + 길이별 묶음 패딩 + 마스크 평균 풀링 KoBigBird 인코더 (CPU 추론용)
+        - quantize=True: nn.Linear 를 int8 동적 양자화 (속도↑, 임베딩이 약간 달라짐 → bench_kobigbird.py 로 확인)
+        - num_threads: torch 연산 스레드 수 (None 이면 torch 기본값) """
+
+    def __init__(self, model_name=MODEL_NAME, max_length=MAX_LENGTH, batch_size=BATCH_SIZE,
+                 num_threads=None, quantize=False):
+        if num_threads:
+            torch.set_num_threads(num_threads)
+
+        self.model_name = model_name
+        self.max_length = max_length
+        self.batch_size = batch_size
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = AutoModel.from_pretrained(model_name).eval()
+        if quantize:
+            self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.dim = self.model.config.hidden_size
+
+    # ✅ 문장 목록 → 정규화된 임베딩 행렬 (입력 순서 유지)
+    def encode(self, texts):
+        if not texts:
+            return np.empty((0, self.dim), dtype=np.float32)
+
+        # 🔥 패딩 없이 토큰화 → 길이순 정렬 → 비슷한 길이끼리 배치 (짧은 문장이 512 까지 패딩되지 않게)
+        encoded = self.tokenizer(list(texts), truncation=True, max_length=self.max_length)["input_ids"]
+        order = np.argsort([len(ids) for ids in encoded], kind="stable")
+        embeddings = np.empty((len(texts), self.dim), dtype=np.float32)
+
+        with torch.inference_mode():
+            for start in range(0, len(order), self.batch_size):
+                rows = order[start:start + self.batch_size]
+                batch = self.tokenizer.pad({"input_ids": [encoded[i] for i in rows]}, return_tensors="pt")
+                output = self.model(**batch)
+
+                # ✅ Mean Pooling (attention_mask 로 패딩 토큰 제외)
+                mask = batch["attention_mask"].unsqueeze(-1).to(output.last_hidden_state.dtype)
+                pooled = (output.last_hidden_state * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+                embeddings[rows] = pooled.float().numpy()
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embeddings / norms  # ✅ 벡터 정규화
+
+    def encode_one(self, text):
+        return self.encode([text])[0]
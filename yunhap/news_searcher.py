@@ -0,0 +1,169 @@
+import os
+import time
+import logging
+import threading
+import numpy as np
+from vector_index import NewsVectorIndex, INDEX_DIR
+from ivf_index import IVFIndex
+from bm25_index import BM25Index
+
+# ✅ 검색 로그 (기본은 출력 안 함 → logging.basicConfig(level=logging.DEBUG) 로 확인)
+logger = logging.getLogger(__name__)
+
+CANDIDATE_K = 50  # ✅ 벡터/BM25 각각에서 가져올 후보 수
+RRF_K = 60  # ✅ RRF 순위 완화 상수 (1 / (RRF_K + 순위))
+BM25_SATURATION = 3.0  # ✅ BM25 점수가 이 값이면 0.5 (단어 하나당 최대 idf, 흔하지 않은 단어 하나가 제목에 맞으면 약 2~3)
+
+
+# ✅ BM25 점수를 0~1 로 변환 (s / (s + k))
+#    🔥 후보 안의 최고점으로 나누면 약하게 맞은 문서도 항상 1.0 이 되므로, 후보와 상관없는 절대 기준 사용
+def saturate_scores(scores, k=BM25_SATURATION):
+    scores = np.maximum(np.asarray(scores, dtype=np.float32), 0)
+    return scores / (scores + k)
+
+
+# ✅ 점수 내림차순 순위 (1위 = 1)
+def ranks(scores):
+    order = np.argsort(-np.asarray(scores), kind="stable")
+    result = np.empty(len(order), dtype=np.float32)
+    result[order] = np.arange(1, len(order) + 1)
+    return result
+
+
+class NewsSearcher:
+    """ 벡터 인덱스 + BM25 역색인에서 각각 상위 후보를 뽑아 점수를 합치는 하이브리드 검색기
+        - fusion="weighted": vector_weight × 코사인 유사도 + text_weight × BM25/(BM25 + bm25_saturation)
+        - fusion="rrf"     : 두 순위의 Reciprocal Rank Fusion (두 목록 모두 1위면 1.0)
+        - thresholds (0.5, 0.4): 가중치 0.5/0.5 기준 검색어와 관련 없는 뉴스(코사인 0.2~0.4, BM25 0)는 0.1~0.2 로 탈락,
+          코사인 0.6 이상이면서 검색어 단어가 맞은 뉴스(BM25 3 이상 → 0.5 이상)는 0.55 이상으로 통과 """
+
+    def __init__(self, collection, model_name, encode_query, tokenizer, dim=None, bm25_index=None,
+                 fusion="weighted", vector_weight=0.5, text_weight=0.5, thresholds=(0.5, 0.4),
+                 candidate_k=CANDIDATE_K, rrf_k=RRF_K, bm25_saturation=BM25_SATURATION, mode="exact", nprobe=None,
+                 refresh_interval=0, index_dir=INDEX_DIR):
+        self.collection = collection
+        self.model_name = model_name
+        self.encode_query = encode_query  # ✅ 검색어 → 쿼리 벡터 (모델마다 다름)
+        self.tokenizer = tokenizer
+        self.fusion = fusion
+        self.vector_weight = vector_weight
+        self.text_weight = text_weight
+        self.thresholds = thresholds  # ✅ 앞에서부터 적용, 결과가 없으면 다음 기준 (재검색 없이 같은 점수 사용)
+        self.candidate_k = candidate_k
+        self.rrf_k = rrf_k
+        self.bm25_saturation = bm25_saturation
+        self.mode = mode
+        self.nprobe = nprobe
+        self.refresh_interval = refresh_interval  # ✅ 이 시간(초) 안에는 MongoDB 에 새 뉴스를 다시 묻지 않음 (검색 서버용)
+        self.last_refresh = 0.0
+        self.lock = threading.Lock()  # 🔥 인덱스 갱신과 검색이 동시에 일어나지 않게 (여러 스레드에서 검색하는 경우)
+
+        self.index_dir = index_dir  # ✅ 인덱스 파일 폴더 (벤치마크는 임시 폴더 사용)
+        self.news_index = NewsVectorIndex(collection, model_name, dim=dim, index_dir=index_dir).load()
+        self.bm25_index = bm25_index or BM25Index(  # ✅ 여러 모델이 같은 역색인 공유 가능
+            collection, tokenizer, path=os.path.join(index_dir, "bm25.pkl")).load()
+        self.ivf_index = None
+
+    # ✅ 근사 검색(IVF) 인덱스 (mode="ivf" 로 처음 검색할 때 로드/생성)
+    def get_ivf_index(self, added=0):
+        if self.ivf_index is None:
+            self.ivf_index = IVFIndex.load_or_build(self.news_index, index_dir=self.index_dir)
+        elif added:
+            self.ivf_index.add(self.news_index.ids[-added:], self.news_index.matrix[-added:])  # 🔥 새로 반영된 뉴스만 추가
+        return self.ivf_index
+
+    # ✅ 새로 저장된 뉴스를 두 인덱스에 반영
+    def refresh(self):
+        self.last_refresh = time.monotonic()
+        added = self.news_index.refresh()
+        if added and self.ivf_index is not None:
+            self.get_ivf_index(added)
+        with self.bm25_index.lock:
+            self.bm25_index.refresh()
+        return added
+
+    # ✅ 후보 (_id 목록, 코사인 유사도, BM25 점수) - 한쪽 목록에만 있는 후보는 다른 점수를 인덱스에서 바로 계산
+    def candidates(self, query_vector, query_terms, candidate_k, mode, nprobe):
+        if mode == "ivf":
+            vector_ids, similarities = self.get_ivf_index().search(query_vector, candidate_k, nprobe=nprobe)
+        else:
+            vector_ids, similarities = self.news_index.search(query_vector, candidate_k)
+        with self.bm25_index.lock:
+            lexical_ids, _ = self.bm25_index.search(query_terms, candidate_k)
+
+        seen = set(vector_ids)
+        extra_ids = [news_id for news_id in lexical_ids if news_id not in seen]
+        news_ids = list(vector_ids) + extra_ids
+        similarities = np.concatenate([np.asarray(similarities, dtype=np.float32),
+                                       self.news_index.similarities(query_vector, extra_ids)])
+        with self.bm25_index.lock:
+            text_scores = np.asarray(self.bm25_index.score(query_terms, news_ids), dtype=np.float32)
+        return news_ids, similarities, text_scores, len(vector_ids), len(lexical_ids)
+
+    def fuse(self, similarities, text_scores):
+        if self.fusion == "rrf":
+            fused = self.vector_weight / (self.rrf_k + ranks(similarities))
+            fused += self.text_weight / (self.rrf_k + np.where(text_scores > 0, ranks(text_scores), np.inf))
+            return fused * (self.rrf_k + 1) / (self.vector_weight + self.text_weight)
+        return self.vector_weight * similarities + self.text_weight * saturate_scores(text_scores, self.bm25_saturation)
+
+    # ✅ 검색 → 점수 내림차순 뉴스 목록 (news["similarity"] = 최종 점수 %, vector_similarity / text_score 포함)
+    #    query_vector 를 주면 인코딩을 건너뜀 (검색 서버가 여러 검색어를 모아 배치로 인코딩한 경우)
+    def search(self, query, top_n=5, thresholds=None, candidate_k=None, mode=None, nprobe=None, query_vector=None):
+        start = time.perf_counter()
+        thresholds = thresholds or self.thresholds
+        candidate_k = max(candidate_k or self.candidate_k, top_n)
+        if query_vector is None:
+            query_vector = self.encode_query(query)
+        query_terms = self.tokenizer.nouns(query)
+
+        with self.lock:
+            if time.monotonic() - self.last_refresh >= self.refresh_interval:
+                self.refresh()
+            news_ids, similarities, text_scores, vector_count, lexical_count = self.candidates(
+                query_vector, query_terms, candidate_k, mode or self.mode, nprobe or self.nprobe)
+        if not news_ids:
+            return []
+
+        scores = self.fuse(similarities, text_scores)
+        order = np.argsort(-scores, kind="stable")
+
+        # 🔥 기준을 낮춰 가며 같은 점수로 다시 거름 (컬렉션 재검색 없음)
+        used_threshold = thresholds[-1]
+        for threshold in thresholds:
+            if scores[order[0]] >= threshold:
+                used_threshold = threshold
+                break
+        top = [i for i in order[:top_n] if scores[i] >= used_threshold]
+
+        news_by_id = {news["_id"]: news for news in
+                      self.collection.find({"_id": {"$in": [news_ids[i] for i in top]}}, {"vector": 0})}
+        results = []
+        for i in top:
+            news = news_by_id.get(news_ids[i])
+            if news:
+                news["similarity"] = round(float(scores[i]) * 100, 2)
+                news["vector_similarity"] = round(float(similarities[i]) * 100, 2)
+                news["text_score"] = round(float(text_scores[i]), 4)
+                results.append(news)
+
+        logger.debug("search query=%r terms=%s model=%s fusion=%s vector_candidates=%d lexical_candidates=%d "
+                     "candidates=%d threshold=%.2f results=%d elapsed_ms=%.1f",
+                     query, query_terms, self.model_name, self.fusion, vector_count, lexical_count,
+                     len(news_ids), used_threshold, len(results), (time.perf_counter() - start) * 1000)
+        return results
+
+
+# ✅ 검색 결과 출력
+def print_results(query, results):
+    if results:
+        print(f"\n🔍 검색어 '{query}'에 대한 검색 결과:")
+        for idx, news in enumerate(results, start=1):
+            print(f"\n[{idx}] {news['title']}  (유사도: {news['similarity']}%)")
+            print(f"📅 {news['date']}")
+            print(f"🔗 {news['link']}")
+            if news.get("summary"):  # ✅ 오프라인(벡터 샤드) 결과에는 요약 없음
+                print(f"📝 {news['summary']}")
+            print("-" * 80)
+    else:
+        print(f"\n❌ 검색어 '{query}'에 대한 적절한 뉴스가 없습니다.")
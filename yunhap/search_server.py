@@ -0,0 +1,215 @@
+import sys
+import json
+import time
+import queue
+import threading
+import numpy as np
+from concurrent.futures import Future
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+# ✅ 뉴스 검색 서버 (모델/Mecab/인덱스를 한 번만 올려 두고 계속 사용)
+#   사용법: python search_server.py [모델 이름 ...]  (기본 sbert, 예: python search_server.py sbert kobigbird)
+#   검색: GET http://127.0.0.1:8767/search?q=전세사고&model=sbert&top_n=5&mode=exact
+#   상태: GET http://127.0.0.1:8767/health
+PORT = 8767
+MAX_BATCH = 32  # ✅ 한 번에 인코딩할 최대 검색어 수
+MAX_WAIT = 0.005  # ✅ 첫 검색어가 들어온 뒤 같은 배치에 묶을 검색어를 기다리는 시간 (초)
+REFRESH_INTERVAL = 5  # ✅ 새 뉴스 반영 주기 (초) - 검색마다 MongoDB 에 묻지 않음
+WARMUP_QUERY = "전세사고"
+MAX_TOP_N = 50  # ✅ 한 번에 돌려줄 최대 결과 수 (top_n 은 1 ~ MAX_TOP_N 로 제한)
+
+
+class BatchEncoder:
+    """ 여러 스레드에서 동시에 들어온 검색어를 모아 model.encode / forward 한 번으로 처리 """
+
+    def __init__(self, encode_batch, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+        self.encode_batch = encode_batch  # ✅ 검색어 목록 → 쿼리 벡터 행렬
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = queue.Queue()
+        self.batches = 0
+        self.queries = 0
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def encode(self, query):
+        future = Future()
+        self.queue.put((query, future))
+        return future.result()
+
+    def collect(self):
+        batch = [self.queue.get()]
+        if batch[0] is None:
+            return None
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self.queue.put(None)  # 🔥 이번 배치를 끝낸 뒤 종료
+                break
+            batch.append(item)
+        return batch
+
+    def run(self):
+        while True:
+            batch = self.collect()
+            if batch is None:
+                return
+            try:
+                vectors = self.encode_batch([query for query, _ in batch])
+                for (_, future), vector in zip(batch, vectors):
+                    future.set_result(np.asarray(vector, dtype=np.float32))
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+            self.batches += 1
+            self.queries += len(batch)
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+    def stats(self):
+        return {"batches": self.batches, "queries": self.queries,
+                "avg_batch": round(self.queries / self.batches, 2) if self.batches else 0}
+
+
+# ✅ 모델별 (검색기, 배치 인코딩 함수) - 검색 스크립트 모듈을 그대로 재사용 (요청한 모델만 로드)
+#    bm25_index 를 주면 그 역색인을 같이 사용 (모델과 상관없는 명사 색인이라 하나만 올려 둠)
+def load_sbert(bm25_index=None):
+    import search_keyword as module
+
+    def encode_batch(queries):
+        keywords = [module.extract_keywords(query, query) for query in queries]
+        return module.model.encode(keywords, batch_size=len(keywords)).astype(np.float32)
+    return module.get_searcher(bm25_index), encode_batch
+
+
+def load_kobigbird(bm25_index=None):
+    import search_keyword2 as module
+
+    def encode_batch(queries):
+        return module.get_embeddings([module.extract_keywords(query, query) for query in queries])
+    return module.get_searcher(bm25_index), encode_batch
+
+
+MODEL_LOADERS = {"sbert": load_sbert, "kobigbird": load_kobigbird}
+
+
+class SearchService:
+    """ 모델 이름 → (NewsSearcher, BatchEncoder) """
+
+    def __init__(self, engines):
+        self.engines = engines
+        self.default_model = next(iter(engines))
+
+    @classmethod
+    def load(cls, model_names, refresh_interval=REFRESH_INTERVAL):
+        engines = {}
+        bm25_index = None  # 🔥 첫 모델이 만든 BM25 역색인을 나머지 모델도 사용 (같은 bm25.pkl 을 여러 번 로드/저장하지 않음)
+        for name in model_names:
+            searcher, encode_batch = MODEL_LOADERS[name](bm25_index)
+            bm25_index = searcher.bm25_index
+            searcher.refresh_interval = refresh_interval
+            engines[name] = (searcher, BatchEncoder(encode_batch))
+            print(f"✅ 검색 모델 로드: {name} ({searcher.model_name})")
+        service = cls(engines)
+        service.warmup()
+        return service
+
+    # ✅ 첫 검색이 느리지 않게 모델별로 한 번 실행 (forward 준비 + 인덱스 갱신)
+    def warmup(self, query=WARMUP_QUERY):
+        for name in self.engines:
+            self.search(query, name)
+
+    def search(self, query, model=None, top_n=5, **options):
+        searcher, encoder = self.engines[model or self.default_model]
+        return searcher.search(query, top_n, query_vector=encoder.encode(query), **options)
+
+    def stats(self):
+        return {name: dict(encoder.stats(), documents=len(searcher.news_index))
+                for name, (searcher, encoder) in self.engines.items()}
+
+    def close(self):
+        for _, encoder in self.engines.values():
+            encoder.close()
+
+
+def news_to_json(news):
+    return {key: str(value) if key == "_id" else value for key, value in news.items()}
+
+
+def make_handler(service):
+    class SearchHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+            if url.path == "/health":
+                self.send_json(200, {"models": service.stats()})
+                return
+            if url.path != "/search":
+                self.send_json(404, {"error": "not found"})
+                return
+            if not params.get("q"):
+                self.send_json(400, {"error": "q 파라미터가 필요합니다"})
+                return
+            model = params.get("model", service.default_model)
+            if model not in service.engines:
+                self.send_json(404, {"error": f"로드되지 않은 모델: {model}", "models": list(service.engines)})
+                return
+
+            try:
+                top_n = min(max(int(params.get("top_n", 5)), 1), MAX_TOP_N)
+            except ValueError:
+                self.send_json(400, {"error": f"top_n 은 정수여야 합니다: {params['top_n']}"})
+                return
+
+            start = time.perf_counter()
+            options = {"mode": params["mode"]} if params.get("mode") else {}
+            results = service.search(params["q"], model, top_n, **options)
+            self.send_json(200, {
+                "query": params["q"],
+                "model": model,
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+                "results": [news_to_json(news) for news in results],
+            })
+
+        def send_json(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return SearchHandler
+
+
+def start_server(service, host="127.0.0.1", port=0):
+    """ 백그라운드 스레드로 서버 시작 → (server, 검색 URL) 반환 (port=0 이면 빈 포트 자동 선택) """
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/search"
+
+
+if __name__ == "__main__":
+    service = SearchService.load(sys.argv[1:] or ["sbert"])
+    server, url = start_server(service, port=PORT)
+    print(f"✅ 뉴스 검색 서버 실행: {url}?q=전세사고")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+        service.close()
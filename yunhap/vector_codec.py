@@ -0,0 +1,50 @@
+import numpy as np
+from bson import Binary
+
+# ✅ 뉴스 벡터 저장 형식
+#   - 이전: "vector": [0.1, 0.2, ...]  (BSON double 배열, 768차원이면 double 768개)
+#   - 현재: "vector": {"model": 모델 이름, "dim": 차원, "dtype": "float32"|"float16", "data": Binary(little-endian 바이트)}
+#   읽을 때는 두 형식 모두 지원 (이전 문서는 generate_vector.py 로 다시 저장하면 변환됨)
+VECTOR_DTYPE = "float32"  # ✅ "float16" 이면 용량 절반 (코사인 유사도 오차 ~1e-3)
+DTYPES = {"float32": np.dtype("<f4"), "float16": np.dtype("<f2")}
+
+
+def encode_vector(vector, model_name, dtype=VECTOR_DTYPE):
+    array = np.asarray(vector, dtype=DTYPES[dtype]).ravel()
+    return {"model": model_name, "dim": len(array), "dtype": dtype, "data": Binary(array.tobytes())}
+
+
+def encode_vectors(vectors, model_name, dtype=VECTOR_DTYPE):
+    return [encode_vector(vector, model_name, dtype) for vector in vectors]
+
+
+# ✅ 저장된 벡터의 차원 (형식과 상관없이, 없으면 0)
+def vector_dim(value):
+    if isinstance(value, dict):
+        return value.get("dim", 0)
+    return len(value) if value else 0
+
+
+# ✅ 저장된 벡터의 모델 이름 (이전 형식은 None)
+def vector_model(value):
+    return value.get("model") if isinstance(value, dict) else None
+
+
+# ✅ 저장된 벡터 → numpy 배열 (바이너리는 np.frombuffer 로 원소별 변환 없이 읽음)
+def decode_vector(value):
+    if isinstance(value, dict):
+        return np.frombuffer(value["data"], dtype=DTYPES[value.get("dtype", "float32")])
+    return np.asarray(value, dtype=np.float32)
+
+
+# ✅ 저장된 벡터 목록 → 미리 할당한 (N, dim) float32 행렬에 바로 채움
+def decode_into(values, out):
+    for row, value in enumerate(values):
+        out[row] = decode_vector(value)
+    return out
+
+
+def decode_vectors(values, dim=None):
+    values = list(values)
+    dim = dim or (vector_dim(values[0]) if values else 0)
+    return decode_into(values, np.empty((len(values), dim), dtype=np.float32))
@@ -0,0 +1,151 @@
+import os
+import re
+import numpy as np
+from bson import ObjectId
+from vector_codec import decode_into, vector_dim, vector_model
+
+# ✅ 인덱스 파일 저장 폴더 (yna.py 의 DATA_DIR 기준)
+INDEX_DIR = "../data/index"
+
+
+# ✅ 모델 이름을 파일 이름으로 쓸 수 있게 변환 (예: snunlp/KR-SBERT → snunlp_KR-SBERT)
+def model_file_name(model_name):
+    return re.sub(r"[^0-9A-Za-z_.-]+", "_", model_name)
+
+
+# ✅ 해당 모델로 만든 벡터만 조회하는 MongoDB 조건 (모델 이름이 없는 이전 형식 벡터도 포함)
+#    🔥 다른 모델(yna.py 의 MiniLM 등) 벡터는 DB 에서 걸러서 매번 다시 읽지 않음
+def model_query(model_name):
+    return {"$or": [{"vector.model": model_name},
+                    {"vector.model": {"$exists": False}, "vector": {"$exists": True, "$ne": []}}]}
+
+
+# ✅ 행 단위 L2 정규화 (0 벡터는 그대로 둠)
+def normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class NewsVectorIndex:
+    """ latest_news 벡터를 정규화된 float32 행렬 + _id 배열로 메모리에 올려두는 검색 인덱스 """
+
+    def __init__(self, collection, model_name, dim=None, index_dir=INDEX_DIR):
+        self.collection = collection
+        self.model_name = model_name
+        self.dim = dim
+        self.path = os.path.join(index_dir, f"{model_file_name(model_name)}.npz")
+
+        self.matrix = np.empty((0, dim or 0), dtype=np.float32)  # ✅ (N, dim) 연속 행렬
+        self.ids = np.empty(0, dtype="U24")  # ✅ matrix 행과 같은 순서의 ObjectId 문자열
+        self.last_id = None  # ✅ 마지막으로 반영한 _id (증분 갱신 기준)
+
+    def __len__(self):
+        return len(self.ids)
+
+    # ✅ 디스크 캐시 로드 후 새로 저장된 뉴스만 추가
+    def load(self):
+        if os.path.exists(self.path):
+            with np.load(self.path) as data:
+                matrix = data["matrix"]
+                if self.dim is None or matrix.shape[1] == self.dim:
+                    self.matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+                    self.ids = data["ids"]
+                    self.dim = matrix.shape[1]
+                    self.last_id = ObjectId(str(data["last_id"])) if str(data["last_id"]) else None
+                    print(f"✅ 벡터 인덱스 로드: {self.path} ({len(self)}개)")
+                else:
+                    print(f"⚠️ 인덱스 차원 불일치 ({matrix.shape[1]} ≠ {self.dim}) → 다시 생성")
+        self.refresh()
+        return self
+
+    # ✅ 마지막 _id 이후에 저장된 뉴스 벡터만 가져와 행렬에 이어 붙임
+    def refresh(self):
+        query = model_query(self.model_name)
+        if self.last_id is not None:
+            query["_id"] = {"$gt": self.last_id}
+
+        last_id = self.last_id
+        new_ids, new_vectors, skipped = [], [], 0
+        for news in self.collection.find(query, {"vector": 1}).sort("_id", 1):
+            self.last_id = news["_id"]  # 🔥 제외한 문서도 지나감 (다음 갱신 때 다시 읽지 않음)
+            vector = news.get("vector")
+            dim = vector_dim(vector)
+            if not dim:
+                continue
+            if self.dim is None:
+                self.dim = dim
+            model = vector_model(vector)
+            if dim != self.dim or (model is not None and model != self.model_name):
+                skipped += 1  # 🔥 다른 모델로 만든 벡터는 제외
+                continue
+            new_ids.append(str(news["_id"]))
+            new_vectors.append(vector)
+
+        if skipped:
+            print(f"⚠️ 다른 모델/차원의 벡터 {skipped}개 제외 (인덱스: {self.model_name}, {self.dim}차원)")
+        if not new_ids:
+            if self.last_id != last_id:
+                self.save()
+            return 0
+
+        # ✅ 미리 할당한 행렬에 바로 디코딩 (바이너리 벡터는 원소별 변환 없음)
+        added = normalize_rows(decode_into(new_vectors, np.empty((len(new_vectors), self.dim), dtype=np.float32)))
+        if len(self.ids):
+            self.matrix = np.ascontiguousarray(np.vstack([self.matrix, added]))
+        else:
+            self.matrix = np.ascontiguousarray(added)
+        self.ids = np.concatenate([self.ids, np.asarray(new_ids, dtype="U24")])
+        self.save()
+        print(f"✅ 벡터 인덱스 갱신: {len(new_ids)}개 추가 (총 {len(self)}개)")
+        return len(new_ids)
+
+    # ✅ 벡터를 다시 만든 경우 (generate_vector.py) 전체 재구성
+    def rebuild(self):
+        self.matrix = np.empty((0, self.dim or 0), dtype=np.float32)
+        self.ids = np.empty(0, dtype="U24")
+        self.last_id = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.refresh()
+        return self
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        np.savez(self.path, matrix=self.matrix, ids=self.ids, last_id=str(self.last_id or ""))
+
+    # ✅ 행렬-벡터 곱 한 번 + argpartition 으로 상위 top_k 코사인 유사도 계산
+    def search(self, query_vector, top_k=5):
+        if not len(self):
+            return [], np.empty(0, dtype=np.float32)
+
+        query = np.asarray(query_vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        scores = self.matrix @ query
+        if top_k < len(scores):
+            top = np.argpartition(-scores, top_k)[:top_k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top])]
+        return [ObjectId(i) for i in self.ids[top]], scores[top]
+
+    # ✅ 지정한 _id 들의 코사인 유사도 (인덱스에 없는 _id 는 0)
+    #    ids 는 _id 오름차순으로 쌓이므로 searchsorted 로 행 위치를 찾음
+    def similarities(self, query_vector, news_ids):
+        keys = np.asarray([str(news_id) for news_id in news_ids], dtype="U24")
+        scores = np.zeros(len(keys), dtype=np.float32)
+        if not len(self) or not len(keys):
+            return scores
+
+        query = np.asarray(query_vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        rows = np.minimum(np.searchsorted(self.ids, keys), len(self.ids) - 1)
+        found = self.ids[rows] == keys
+        scores[found] = self.matrix[rows[found]] @ query
+        return scores
@@ -0,0 +1,152 @@
+import asyncio
+import random
+import aiohttp
+from yna import (BASE_URL, NEWS_SECTION, parse_news_section, drop_near_duplicates, vectorize_texts, save_to_mongodb,
+                 ensure_indexes, collection)
+from metrics import metrics  # ✅ yna.py 가 추가한 상위 경로(sys.path)의 공용 모듈
+
+# ✅ 비동기 목록 크롤링 설정
+MAX_PAGES = 500  # ✅ 최대 페이지 수 (기사 목록이 빈 페이지 / 증분 모드에서 새 기사가 없는 페이지를 만나면 그 전에 종료)
+CONCURRENCY = 4  # ✅ 동시에 요청할 페이지 수 (호스트당)
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0  # ✅ 재시도 대기 (1초, 2초, 4초 … + 랜덤)
+SAVE_BATCH = 200  # ✅ 이 개수만큼 모이면 벡터화 후 저장
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/122.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+
+class FetchFailed(Exception):
+    """ 재시도 후에도 목록 페이지를 받지 못함 (목록 끝과 구분) """
+
+
+# ✅ 목록 페이지 한 개 요청 (429/5xx/타임아웃은 지수 백오프로 재시도)
+#    404 → None (목록 끝), 재시도 후에도 실패 → FetchFailed
+async def fetch_listing(session, page):
+    url = f"{BASE_URL}{page}?site=wholemenu_economy_depth02"
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            with metrics.stage("fetch"):
+                async with session.get(url) as response:
+                    if response.status == 429 or response.status >= 500:
+                        raise aiohttp.ClientResponseError(response.request_info, response.history,
+                                                          status=response.status)
+                    if response.status == 404:
+                        return None
+                    response.raise_for_status()
+                    return await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            metrics.count("fetch_errors")
+            if attempt == MAX_RETRIES:
+                raise FetchFailed(f"{page} 페이지 요청 실패: {e}") from e
+            delay = BACKOFF_BASE * (2 ** attempt) + random.uniform(0, BACKOFF_BASE)
+            print(f"⚠️ {page} 페이지 재시도 {attempt + 1}/{MAX_RETRIES} ({delay:.1f}초 후): {e}")
+            await asyncio.sleep(delay)
+
+
+class ListingCrawler:
+    """ 여러 목록 페이지를 동시에 받아 큐로 넘기고, 기존 정리/키워드/벡터화 단계로 처리하는 크롤러 """
+
+    def __init__(self, max_pages=MAX_PAGES, concurrency=CONCURRENCY, incremental=True, save_batch=SAVE_BATCH):
+        self.max_pages = max_pages
+        self.concurrency = concurrency
+        self.incremental = incremental
+        self.save_batch = save_batch
+        self.next_page = 1
+        self.stop_at = max_pages  # ✅ 목록 끝(빈 페이지) 또는 새 기사가 없는 페이지까지만 요청
+        self.failed_pages = []  # ✅ 재시도 후에도 받지 못한 페이지 (🔥 목록 끝으로 보지 않고 계속 진행)
+        self.saved = 0
+
+    def take_page(self):
+        if self.next_page > self.stop_at:
+            return None
+        page = self.next_page
+        self.next_page += 1
+        return page
+
+    def stop_after(self, page, reason):
+        if page < self.stop_at:
+            print(f"⏹ {reason} → {page + 1} 페이지부터 요청 중단")
+            self.stop_at = page
+
+    # ✅ 페이지 요청 작업자 (페이지 번호를 하나씩 가져가 HTML 을 큐에 넣음)
+    async def fetch_worker(self, session, queue):
+        while (page := self.take_page()) is not None:
+            try:
+                html = await fetch_listing(session, page)
+            except FetchFailed as e:
+                print(f"⛔ {e} (건너뛰고 계속 진행)")
+                metrics.count("failed_pages")
+                self.failed_pages.append(page)
+                continue
+            if html is None:
+                self.stop_after(page - 1, f"{page} 페이지 없음 (404)")
+                continue
+            await queue.put((page, html))
+
+    # ✅ 큐에서 HTML 을 꺼내 파싱 → 모아서 벡터화/저장 (Mecab·모델은 스레드에서 실행)
+    #    기사 수는 목록 구간(NEWS_SECTION)의 div.item-box01 로 셈 (🔥 사이드바/템플릿에도 item-box01 이 있어서 페이지 전체 검사 X)
+    async def process_worker(self, queue):
+        loop = asyncio.get_running_loop()
+        pending = []
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            page, html = item
+            if page > self.stop_at:
+                continue  # ✅ 중단 전에 미리 받아 둔 페이지
+            if NEWS_SECTION[0] not in html:
+                self.stop_after(page - 1, f"{page} 페이지에 기사 목록 없음")  # 🔥 목록 구간이 없으면 페이지 전체를 파싱하므로 먼저 확인
+                continue
+            news_list, article_count, new_count = await loop.run_in_executor(
+                None, parse_news_section, html, self.incremental)
+            print(f"✅ {page} 페이지: 새 기사 {new_count}개 / 전체 {article_count}개")
+            pending.extend(news_list)
+            if not article_count:
+                self.stop_after(page - 1, f"{page} 페이지에 기사 없음")
+            elif self.incremental and new_count == 0:
+                self.stop_after(page, f"{page} 페이지에 새 기사 없음 (이후는 이미 저장된 기사)")
+            if len(pending) >= self.save_batch:
+                await loop.run_in_executor(None, self.save, pending)
+                pending = []
+        if pending:
+            await loop.run_in_executor(None, self.save, pending)
+
+    def save(self, news_list):
+        news_list = drop_near_duplicates(news_list)
+        if not news_list:
+            return
+        vectors = vectorize_texts([news.pop("keywords") for news in news_list])
+        for news, vector in zip(news_list, vectors):
+            news["vector"] = vector
+        save_to_mongodb(news_list, incremental=True)
+        self.saved += len(news_list)
+
+    async def run(self):
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)  # ✅ 파싱이 밀리면 요청도 잠시 대기
+        timeout = aiohttp.ClientTimeout(total=30)
+        connector = aiohttp.TCPConnector(limit_per_host=self.concurrency)
+
+        async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout, connector=connector) as session:
+            processor = asyncio.create_task(self.process_worker(queue))
+            await asyncio.gather(*(self.fetch_worker(session, queue) for _ in range(self.concurrency)))
+            await queue.put(None)
+            await processor
+
+        print(f"✅ 비동기 크롤링 완료! {self.stop_at} 페이지까지, 새 뉴스 {self.saved}개 처리")
+        failed = sorted(page for page in self.failed_pages if page <= self.stop_at)
+        if failed:
+            print(f"⚠️ 요청 실패로 건너뛴 페이지 {len(failed)}개: {failed}")
+        return self.saved
+
+
+# ✅ 실행 (목록 페이지 동시 요청 → 파싱 → 벡터화 → MongoDB 저장)
+if __name__ == "__main__":
+    ensure_indexes()
+    asyncio.run(ListingCrawler().run())
+    print(f"🔍 MongoDB 저장된 뉴스 개수: {collection.count_documents({})}")
+    metrics.report()